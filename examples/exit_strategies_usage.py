@@ -6,6 +6,8 @@ This script demonstrates how to use all available exit strategies
 including the new SignalChangeExit.
 """
 
+import numpy as np
+
 from src.utils.exit_strategies import (
     FixedPercentageStopLoss,
     FixedPercentageTakeProfit,
@@ -15,12 +17,12 @@ from src.utils.exit_strategies import (
     ExitStrategyManager,
 )
 
+_BAR = "=" * 60
+
 
 def example_1_direct_usage():
     """Example 1: Direct instantiation of exit strategies."""
-    print("\n" + "="*60)
-    print("Example 1: Direct Usage of Exit Strategies")
-    print("="*60)
+    print(f"\n{_BAR}\nExample 1: Direct Usage of Exit Strategies\n{_BAR}")
     
     # Create strategies
     stop_loss = FixedPercentageStopLoss(stop_loss_percent=1.0)
@@ -64,9 +66,7 @@ def example_1_direct_usage():
 
 def example_2_trailing_stop():
     """Example 2: Trailing stop with activation threshold."""
-    print("\n" + "="*60)
-    print("Example 2: Trailing Stop with Activation")
-    print("="*60)
+    print(f"\n{_BAR}\nExample 2: Trailing Stop with Activation\n{_BAR}")
     
     # Trailing stop that only activates after +1% profit
     trailing = TrailingStopStrategy(
@@ -109,13 +109,18 @@ def example_2_trailing_stop():
     print(f"Triggered: {signal.triggered}")
     print(f"Reason: {signal.reason}")
     print(f"Exit Price: {signal.exit_price}")
+    
+    # Test 4: Evaluate a whole price path at once (running peak computed internally)
+    print("\nTest 4: Vectorized evaluation over a price path")
+    prices = np.array([1.2550, 1.2650, 1.2750, 1.2720, 1.2680, 1.2700])
+    triggered = trailing.evaluate_series(entry_price, prices, "long")
+    print(f"Triggered per bar: {triggered.tolist()}")
+    print(f"First exit bar: {int(np.argmax(triggered)) if triggered.any() else None}")
 
 
 def example_3_manager_usage():
     """Example 3: Using ExitStrategyManager."""
-    print("\n" + "="*60)
-    print("Example 3: Using ExitStrategyManager")
-    print("="*60)
+    print(f"\n{_BAR}\nExample 3: Using ExitStrategyManager\n{_BAR}")
     
     config = {
         'risk_management': {
@@ -145,9 +150,7 @@ def example_3_manager_usage():
 
 def example_4_factory_pattern():
     """Example 4: Creating strategies from factory."""
-    print("\n" + "="*60)
-    print("Example 4: Factory Pattern")
-    print("="*60)
+    print(f"\n{_BAR}\nExample 4: Factory Pattern\n{_BAR}")
     
     config = {
         'risk_management': {
@@ -174,9 +177,7 @@ def example_4_factory_pattern():
 
 def example_5_signal_change_scenarios():
     """Example 5: Comprehensive signal change scenarios."""
-    print("\n" + "="*60)
-    print("Example 5: Signal Change Exit Scenarios")
-    print("="*60)
+    print(f"\n{_BAR}\nExample 5: Signal Change Exit Scenarios\n{_BAR}")
     
     strategy = SignalChangeExit()
     
@@ -234,9 +235,7 @@ def example_5_signal_change_scenarios():
 
 def example_6_auto_stop_loss():
     """Example 6: Auto Stop Loss - combining all exit strategies."""
-    print("\n" + "="*60)
-    print("Example 6: Auto Stop Loss (All Exits)")
-    print("="*60)
+    print(f"\n{_BAR}\nExample 6: Auto Stop Loss (All Exits)\n{_BAR}")
     
     config = {
         'risk_management': {
@@ -289,9 +288,7 @@ def example_6_auto_stop_loss():
 
 
 if __name__ == "__main__":
-    print("\n" + "="*60)
-    print("EXIT STRATEGY FRAMEWORK - USAGE EXAMPLES")
-    print("="*60)
+    print(f"\n{_BAR}\nEXIT STRATEGY FRAMEWORK - USAGE EXAMPLES\n{_BAR}")
     
     example_1_direct_usage()
     example_2_trailing_stop()
@@ -300,7 +297,5 @@ if __name__ == "__main__":
     example_5_signal_change_scenarios()
     example_6_auto_stop_loss()
     
-    print("\n" + "="*60)
-    print("Examples completed successfully!")
-    print("="*60)
+    print(f"\n{_BAR}\nExamples completed successfully!\n{_BAR}")
     print("\nFor more information, see: docs/EXIT_STRATEGIES.md")
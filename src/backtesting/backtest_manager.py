@@ -2,43 +2,289 @@
 
 Manages data synchronization, multi-symbol backtesting, metrics calculation,
 and result visualization with parameter optimization via backtesting.py.
+
+Workload split: the optimization grid (FractionalBacktest runs) is CPU-bound
+and fans out over a process pool; database reads and writes are IO-bound but
+stay on the caller's thread because a sqlite3 connection cannot be shared
+across threads. Set BACKTEST_PROFILE=1 to write a cProfile dump of each
+run_backtest() call to backtests/profiles/.
 """
 
 import argparse
+import cProfile
+import hashlib
 import json
 import math
 import os
+import pickle
+import sqlite3
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from itertools import product
+from functools import lru_cache
+from itertools import islice, product
+from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+import backtesting
 from backtesting.lib import FractionalBacktest
 from src.backtesting.trade_extractor import TradeExtractor
 from src.core.data_handler import DataHandler
 from src.database.db_manager import DatabaseManager
+from src.strategies import signal_kernels
 from src.strategies.factory import StrategyFactory
+from src.strategies.signal_kernels import clear_indicator_cache
 from src.utils.error_handler import ErrorHandler
 from src.utils.logging_factory import LoggingFactory
 
+# Per-process backtest for parameter-grid workers, built once by _init_grid_worker
+_GRID_BACKTEST = None
+
+
+def _make_grid_backtest(data, strategy_class):
+    """Build the FractionalBacktest shared by every combination in a grid.
+
+    Construction copies and rescales the OHLCV frame, so it is done once per
+    grid (or worker) and each combination only calls ``run``.
+
+    Args:
+        data: OHLCV DataFrame to backtest on
+        strategy_class: backtesting.py Strategy subclass to run
+
+    Returns:
+        FractionalBacktest instance
+    """
+    # Use FractionalBacktest to avoid margin warnings with fractional crypto amounts
+    return FractionalBacktest(
+        data,
+        strategy_class,
+        cash=100000,
+        commission=0.001,
+        exclusive_orders=True,
+        finalize_trades=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def _code_version(strategy_class):
+    """Fingerprint the code that produces cached backtest stats.
+
+    Hashes the source of the strategy's module, the shared signal kernels and
+    this module (grid execution and dropped stats fields), together with the
+    backtesting.py version and CACHE_SCHEMA_VERSION, so editing any of them
+    invalidates earlier cache entries.
+
+    Args:
+        strategy_class: backtesting.py Strategy subclass being run
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256(
+        f"{CACHE_SCHEMA_VERSION}:{backtesting.__version__}".encode()
+    )
+    modules = (
+        sys.modules[strategy_class.__module__],
+        signal_kernels,
+        sys.modules[__name__],
+    )
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _init_grid_worker(data, strategy_class):
+    """Build the shared backtest in a worker process.
+
+    Runs once per worker so the OHLCV frame is pickled and rescaled per
+    process rather than once per parameter combination.
+
+    Args:
+        data: OHLCV DataFrame shared by every combination in the grid
+        strategy_class: backtesting.py Strategy subclass to run
+    """
+    global _GRID_BACKTEST
+    _GRID_BACKTEST = _make_grid_backtest(data, strategy_class)
+
+
+def _run_param_combination(param_dict, bt=None):
+    """Run a single parameter combination through FractionalBacktest.
+
+    Args:
+        param_dict: Strategy parameters passed to ``Backtest.run``
+        bt: Backtest to run, defaults to the worker's shared instance
+
+    Returns:
+        backtesting.py stats Series for the run, without the equity curve and
+        strategy instance
+    """
+    if bt is None:
+        bt = _GRID_BACKTEST
+    stats = bt.run(**param_dict)
+    # The per-bar equity curve and the strategy (which references the full
+    # data) are never read; dropping them keeps grid results, worker IPC and
+    # cache entries to the scalar stats plus the trade list
+    return stats.drop(STATS_UNUSED_FIELDS, errors="ignore")
+
+
+def _run_param_chunk(param_dicts):
+    """Run a contiguous slice of the parameter grid in a worker process.
+
+    Failures are returned in place of stats so one bad combination does not
+    discard the rest of the slice.
+
+    Args:
+        param_dicts: Parameter dictionaries to run with the worker's shared data
+
+    Returns:
+        List with a stats Series or the raised exception per combination
+    """
+    outcomes = []
+    for param_dict in param_dicts:
+        try:
+            outcomes.append(_run_param_combination(param_dict))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+
+def _run_backtest_task(
+    config_dict, symbol, strategy_name, start_date, end_date, timeframe
+):
+    """Compute one (symbol, strategy, timeframe) backtest in a worker process.
+
+    SQLite connections cannot be shared across processes, so each task opens
+    its own read-only BacktestManager; the best run is returned for the
+    parent to store, keeping that process the database's only writer. The
+    nested parameter grid runs serially since the cores are already taken
+    by sibling tasks.
+
+    Args:
+        config_dict: Configuration dictionary of the parent manager
+        symbol: Symbol to backtest
+        strategy_name: Strategy to backtest
+        start_date: Optional start date (YYYY-MM-DD)
+        end_date: Optional end date (YYYY-MM-DD)
+        timeframe: Timeframe in minutes
+
+    Returns:
+        Tuple of (symbol, strategy_name, timeframe, result), where result is
+        the _compute_single_backtest() tuple or None
+    """
+    config = {
+        **config_dict,
+        "backtesting": {**config_dict.get("backtesting", {}), "max_workers": 1},
+    }
+    manager = BacktestManager(config, create_schema=False)
+    try:
+        result = manager._compute_single_backtest(
+            symbol, strategy_name, start_date, end_date, timeframe
+        )
+    finally:
+        manager.db.close()
+    return symbol, strategy_name, timeframe, result
+
+
+# Bulky stats entries that nothing downstream reads
+STATS_UNUSED_FIELDS = ["_equity_curve", "_strategy"]
+
+# Optimizable parameters per strategy, in grid order, with fallback defaults.
+# Strategies not listed here optimize the moving-average crossover pair.
+OPTIMIZATION_GRIDS = {
+    "rsi": (("period", 14), ("overbought", 70), ("oversold", 30)),
+    "macd": (("fast_period", 12), ("slow_period", 26), ("signal_period", 9)),
+}
+DEFAULT_OPTIMIZATION_GRID = (("fast_period", 10), ("slow_period", 20))
+
+# Stored metric name -> backtesting.py stats field, in serialization order
+METRIC_FIELDS = (
+    ("sharpe_ratio", "Sharpe Ratio"),
+    ("sortino_ratio", "Sortino Ratio"),
+    ("profit_factor", "Profit Factor"),
+    ("calmar_ratio", "Calmar Ratio"),
+    ("max_drawdown", "Max. Drawdown [%]"),
+    ("return", "Return [%]"),
+    ("ulcer_index", "Ulcer Index"),
+    ("k_ratio", "K-Ratio"),
+    ("tail_ratio", "Tail Ratio"),
+    ("expectancy", "Expectancy"),
+    ("roe", "Return on Equity"),
+    ("time_to_recover", "Time to Recover"),
+)
+
+# TradeExtractor columns stored per trade; size, pnl and pnl_pct land in the
+# volume, profit and profit_pct columns of backtest_trades
+TRADE_COLUMNS = [
+    "entry_time",
+    "exit_time",
+    "entry_price",
+    "exit_price",
+    "size",
+    "pnl",
+    "pnl_pct",
+    "duration_hours",
+]
+
+# Prepared OHLCV frames kept per manager; run_backtest() revisits each
+# (symbol, timeframe) once per strategy
+DATA_CACHE_SIZE = 16
+# Bump when the layout of cached stats pickles changes
+CACHE_SCHEMA_VERSION = 1
+
+PROFILE_DIR = Path("backtests/profiles")
+
+# INSERT ... RETURNING needs SQLite 3.35+
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Minutes -> M/H label for the configured timeframes
+TIMEFRAME_LABELS = {1: "M1", 5: "M5", 15: "M15", 30: "M30", 60: "H1", 240: "H4"}
+
 
 class BacktestManager:
     """Manages backtesting operations including data sync, execution, and visualization."""
 
-    def __init__(self, config_dict):
+    def __init__(self, config_dict, create_schema=True):
         """Initialize BacktestManager with configuration.
 
         Args:
             config_dict: Configuration dictionary with database and backtesting settings
+            create_schema: Create tables and indexes on connect; pool workers
+                skip it since they only read
         """
         self.config = config_dict
         self.db = DatabaseManager(config_dict["database"])
         self.db.connect()
-        self.db.create_tables()
+        if create_schema:
+            self.db.create_tables()
         self.logger = LoggingFactory.get_logger(__name__)
+        # Opt-in on-disk cache of per-combination stats, keyed by data,
+        # parameters and code version. Entries are pickles, so only enable it
+        # for a cache directory you trust
+        self.use_cache = config_dict.get("backtesting", {}).get("cache", False)
+        self._cache_dir = Path("backtests/cache")
+        # symbol -> tradable_pairs.id, filled once per run_backtest() call
+        self._symbol_ids = {}
+        # lower-cased strategy name -> backtest_strategies.id
+        self._strategy_ids = {}
+        self._data_handler = DataHandler(self.db, self.config)
+        # (symbol, timeframe, start, end) -> prepared DataFrame, in LRU order
+        self._data_cache = OrderedDict()
+        # symbol -> configured timeframes (config order), lower-cased strategy
+        # name -> strategy config; first entry wins, as with the old scans
+        self._pair_timeframes = {}
+        for pair in config_dict.get("pairs", []):
+            self._pair_timeframes.setdefault(pair["symbol"], []).append(
+                pair["timeframe"]
+            )
+        self._strategy_configs = {}
+        for strategy in config_dict.get("strategies", []):
+            self._strategy_configs.setdefault(strategy["name"].lower(), strategy)
+        # lower-cased strategy name -> parameter grid from _build_param_grid()
+        self._param_grids = {}
 
     def _sanitize_value(self, value):
         """Convert NaN and inf values to 0 for JSON serialization.
@@ -96,6 +342,46 @@ class BacktestManager:
         Returns:
             None. Results are saved to database and logged.
         """
+        args = (symbol, strategy_name, start_date, end_date, timeframe)
+        if os.getenv("BACKTEST_PROFILE"):
+            return self._profiled(self._run_backtest, *args)
+        return self._run_backtest(*args)
+
+    def _profiled(self, func, *args):
+        """Run ``func`` under cProfile and dump the stats to PROFILE_DIR.
+
+        Only the calling process is profiled; grid workers run in their own
+        processes and show up as time spent waiting on futures.
+
+        Args:
+            func: Callable to profile
+            *args: Positional arguments for ``func``
+
+        Returns:
+            Whatever ``func`` returns
+        """
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args)
+        finally:
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            name = func.__name__.lstrip("_")
+            path = PROFILE_DIR / f"{name}_{datetime.now():%Y%m%d_%H%M%S_%f}.prof"
+            profiler.dump_stats(str(path))
+            self.logger.info(
+                "Saved profile to %s (inspect with python -m pstats)", path
+            )
+
+    def _run_backtest(self, symbol, strategy_name, start_date, end_date, timeframe):
+        """Backtest every requested symbol/strategy/timeframe combination.
+
+        Args:
+            symbol: Trading symbol, or None for all tradable pairs.
+            strategy_name: Strategy name, or None for all configured strategies.
+            start_date: Optional start date (YYYY-MM-DD).
+            end_date: Optional end date (YYYY-MM-DD).
+            timeframe: Optional explicit timeframe in minutes.
+        """
         # If no strategy specified, backtest all configured strategies
         if strategy_name is None:
             strategies_to_test = self.config.get(
@@ -111,45 +397,36 @@ class BacktestManager:
                 self.logger.error("Strategy %s not found in config", strategy_name)
                 return
 
-        # If no symbol specified, get all symbols from database
+        # Resolve every symbol and strategy id in one query each;
+        # _save_backtest_results reuses them and only writes unseen strategies
+        cursor = self.db.conn.cursor()
+        cursor.execute("SELECT id, symbol FROM tradable_pairs ORDER BY symbol")
+        self._symbol_ids = {row[1]: row[0] for row in cursor.fetchall()}
+        cursor.execute("SELECT id, name FROM backtest_strategies")
+        self._strategy_ids = {row[1]: row[0] for row in cursor.fetchall()}
+
+        # If no symbol specified, backtest every tradable pair
         if symbol is None:
-            cursor = self.db.conn.cursor()
-            cursor.execute("SELECT DISTINCT symbol FROM tradable_pairs")
-            symbols_to_test = [row[0] for row in cursor.fetchall()]
+            symbols_to_test = list(self._symbol_ids)
             if not symbols_to_test:
                 self.logger.warning("No symbols found in tradable_pairs table")
                 return
         else:
             symbols_to_test = [symbol]
 
-        # Get all timeframes from config
-        timeframes_to_test = self.config.get("timeframes", [15, 60, 240])
-
-        # Calculate total tests for progress bar
-        total_tests = len(symbols_to_test) * len(strategies_to_test)
-        if timeframe is None:
-            total_tests *= len(timeframes_to_test)
-
-        # Create progress bar
-        progress_bar = tqdm(total=total_tests, desc="Backtesting", unit="test")
-
-        # Run backtest for each combination
-        for sym in symbols_to_test:
-            for strategy_config in strategies_to_test:
-                # If specific timeframe provided, use it; otherwise test all timeframes
-                if timeframe:
-                    self._run_single_backtest(
-                        sym, strategy_config["name"], start_date, end_date, timeframe
-                    )
-                    progress_bar.update(1)
-                else:
-                    for tf in timeframes_to_test:
-                        self._run_single_backtest(
-                            sym, strategy_config["name"], start_date, end_date, tf
-                        )
-                        progress_bar.update(1)
+        # If specific timeframe provided, use it; otherwise test all timeframes
+        if timeframe:
+            timeframes_to_test = [timeframe]
+        else:
+            timeframes_to_test = self.config.get("timeframes", [15, 60, 240])
 
-        progress_bar.close()
+        tasks = [
+            (sym, strategy_config["name"], tf)
+            for sym in symbols_to_test
+            for strategy_config in strategies_to_test
+            for tf in timeframes_to_test
+        ]
+        self._execute_backtest_tasks(tasks, start_date, end_date)
 
     def _run_single_backtest(
         self, symbol, strategy_name, start_date=None, end_date=None, timeframe=None
@@ -166,17 +443,44 @@ class BacktestManager:
         Returns:
             None. Results are saved to database.
         """
-        strategy_config = next(
-            (
-                s
-                for s in self.config["strategies"]
-                if s["name"].lower() == strategy_name.lower()
-            ),
-            None,
+        result = self._compute_single_backtest(
+            symbol, strategy_name, start_date, end_date, timeframe
         )
+        if result is None:
+            return
+        try:
+            self._save_backtest_results(*result)
+        except Exception as exc:
+            ErrorHandler.handle_error(exc, context="save_backtest_results")
+
+        # Note: Equity curve plotting removed per user request - only terminal progress required
+        # Files would be saved to: backtests/results/equity_curve_{symbol}_{strategy_name}.html
+        # View results in web dashboard instead: http://127.0.0.1:5000/backtest
+
+        # Generate optimization heatmap (for RSI only, as example)
+        # Note: Heatmap generation removed per user request - only terminal progress required
+
+    def _compute_single_backtest(
+        self, symbol, strategy_name, start_date=None, end_date=None, timeframe=None
+    ):
+        """Optimize a single symbol/strategy combination without writing results.
+
+        Args:
+            symbol: Trading symbol (e.g., 'BTCUSD').
+            strategy_name: Name of strategy to backtest.
+            start_date: Optional start date.
+            end_date: Optional end date.
+            timeframe: Optional explicit timeframe.
+
+        Returns:
+            Tuple of (symbol, strategy_name, tf_str, metrics, best_stats,
+            best_params) for _save_backtest_results(), or None when there is
+            no data or no run qualifies
+        """
+        strategy_config = self._strategy_configs.get(strategy_name.lower())
         if not strategy_config:
             self.logger.error("Strategy %s not found in config", strategy_name)
-            return
+            return None
 
         # Get date range from args or config
         if not start_date or not end_date:
@@ -193,14 +497,11 @@ class BacktestManager:
 
         # Use explicit timeframe if provided, otherwise get first matching from config
         if timeframe is None:
-            tf = next(
-                (p["timeframe"] for p in self.config["pairs"] if p["symbol"] == symbol),
-                15,
-            )
+            tf = self._pair_timeframes.get(symbol, [15])[0]
         else:
             tf = timeframe
 
-        tf_str = f"M{tf}" if tf < 60 else f"H{tf//60}"
+        tf_str = self._timeframe_label(tf)
 
         self.logger.info("=" * 80)
         self.logger.info(
@@ -219,20 +520,10 @@ class BacktestManager:
             end_date,
         )
 
-        # Fetch backtest data
-        data_handler = DataHandler(self.db, self.config)
-        data = data_handler.prepare_backtest_data(symbol, tf_str)
+        # Fetch backtest data for the requested window only
+        # (no weekend restrictions for historical backtest)
+        data = self._get_prepared_data(symbol, tf_str, start_date, end_date)
         if data is None or data.empty:
-            self.logger.error("No data available for %s (%s)", symbol, tf_str)
-            return
-
-        # Filter data by date range (no weekend restrictions for historical backtest)
-        # Data has Datetime as index from prepare_backtest_data()
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date)
-        data = data[(data.index >= start_dt) & (data.index <= end_dt)]
-
-        if data.empty:
             self.logger.error(
                 "No data in range %s to %s for %s (%s)",
                 start_date,
@@ -240,7 +531,7 @@ class BacktestManager:
                 symbol,
                 tf_str,
             )
-            return
+            return None
 
         self.logger.info(
             "Backtest data: %d rows from %s to %s",
@@ -258,208 +549,474 @@ class BacktestManager:
             config=self.config,
         ).backtest_strategy
 
-        # Optimization parameters
-        opt_params = (
-            self.config.get("backtesting", {})
-            .get("optimization", {})
-            .get(strategy_name.lower(), {})
-        )
-        if strategy_name.lower() == "rsi":
-            param_combinations = list(
-                product(
-                    opt_params.get(
-                        "period", [strategy_config["params"].get("period", 14)]
-                    ),
-                    opt_params.get(
-                        "overbought", [strategy_config["params"].get("overbought", 70)]
-                    ),
-                    opt_params.get(
-                        "oversold", [strategy_config["params"].get("oversold", 30)]
-                    ),
-                )
-            )
-            param_keys = ["period", "overbought", "oversold"]
-        elif strategy_name.lower() == "macd":
-            param_combinations = list(
-                product(
-                    opt_params.get(
-                        "fast_period",
-                        [strategy_config["params"].get("fast_period", 12)],
-                    ),
-                    opt_params.get(
-                        "slow_period",
-                        [strategy_config["params"].get("slow_period", 26)],
-                    ),
-                    opt_params.get(
-                        "signal_period",
-                        [strategy_config["params"].get("signal_period", 9)],
-                    ),
-                )
-            )
-            param_keys = ["fast_period", "slow_period", "signal_period"]
-        else:  # SMA, EMA - only fast_period and slow_period
-            param_combinations = list(
-                product(
-                    opt_params.get(
-                        "fast_period",
-                        [strategy_config["params"].get("fast_period", 10)],
-                    ),
-                    opt_params.get(
-                        "slow_period",
-                        [strategy_config["params"].get("slow_period", 20)],
-                    ),
-                )
+        # Optimization parameters; the grid only depends on the strategy's
+        # config, so it is built once and reused for every symbol/timeframe
+        optimization = self.config.get("backtesting", {}).get("optimization", {})
+        grid_key = strategy_name.lower()
+        param_dicts = self._param_grids.get(grid_key)
+        if param_dicts is None:
+            param_dicts = self._param_grids[grid_key] = self._build_param_grid(
+                strategy_name,
+                strategy_config["params"],
+                optimization.get(grid_key, {}),
+                optimization.get("max_combos"),
             )
-            param_keys = ["fast_period", "slow_period"]
 
         # Run backtests with optimization
         best_stats = None
         best_params = None
-        results = []
-        for params in param_combinations:
-            param_dict = dict(zip(param_keys, params))
-            param_dict["volume"] = strategy_config["params"].get("volume", 0.01)
-            # Use FractionalBacktest to avoid margin warnings with fractional crypto amounts
-            bt = FractionalBacktest(
-                data,
-                strategy_class,
-                cash=100000,
-                commission=0.001,
-                exclusive_orders=True,
-                finalize_trades=True,
-            )
-            try:
-                stats = bt.run(**param_dict)
-                results.append((param_dict, stats))
-                if best_stats is None or stats.get("Sharpe Ratio", 0) > best_stats.get(
-                    "Sharpe Ratio", 0
-                ):
-                    best_stats = stats
-                    best_params = param_dict
-            except Exception as exc:
-                ErrorHandler.handle_error(exc, context="backtest_run")
+        cache_context = None
+        if self.use_cache:
+            cache_context = {
+                "symbol": symbol,
+                "timeframe": tf_str,
+                "strategy": strategy_name.lower(),
+                "data_hash": self._hash_data(data),
+                "code_version": _code_version(strategy_class),
+            }
+        results = self._run_param_grid(data, strategy_class, param_dicts, cache_context)
+        # Runs with too few trades give unreliable ratios and cannot be selected
+        min_trades = optimization.get("min_trades", 0)
+        best_sharpe = None
+        for param_dict, stats in results:
+            if stats.get("# Trades", 0) < min_trades:
                 continue
+            sharpe = stats.get("Sharpe Ratio", 0)
+            if best_stats is None or sharpe > best_sharpe:
+                best_stats = stats
+                best_params = param_dict
+                best_sharpe = sharpe
+
+        if best_stats is None:
+            return None
+        metrics = {
+            name: self._sanitize_value(best_stats.get(stat, 0))
+            for name, stat in METRIC_FIELDS
+        }
+        return symbol, strategy_name, tf_str, metrics, best_stats, best_params
+
+    def _save_backtest_results(
+        self, symbol, strategy_name, tf_str, metrics, best_stats, best_params
+    ):
+        """Persist the best run's metrics and parameters atomically, then its trades.
 
-        # Save results
-        if best_stats is not None:
-            # best_stats is a pandas Series - convert to dict for consistent access
-            stats_dict = (
-                best_stats.to_dict() if hasattr(best_stats, "to_dict") else best_stats
+        Args:
+            symbol: Trading symbol
+            strategy_name: Strategy name
+            tf_str: Timeframe string (e.g., 'M15', 'H1')
+            metrics: Sanitized metrics dictionary for the best run
+            best_stats: Stats object of the best run
+            best_params: Parameter dictionary of the best run
+
+        Returns:
+            True if the run was stored, False if the symbol is unknown
+        """
+        symbol_id = self._get_symbol_id(symbol)
+        if symbol_id is None:
+            self.logger.error("Symbol %s not found in tradable_pairs", symbol)
+            return False
+        # Resolved outside the transaction so a rollback never leaves a cached id
+        # pointing at an uncommitted row
+        strategy_id = self._get_strategy_id(strategy_name)
+
+        with self.db.transaction():
+            metrics["rank_score"] = float(self._rank_scores([metrics])[0])
+
+            # INSERT OR REPLACE swaps the backtest row for a new one, which the
+            # previous run's trades still reference; drop them first
+            self.db.execute_query(
+                "DELETE FROM backtest_trades WHERE backtest_backtest_id IN "
+                "(SELECT id FROM backtest_backtests "
+                "WHERE strategy_id = ? AND symbol_id = ? AND timeframe = ?)",
+                (strategy_id, symbol_id, tf_str),
             )
-            metrics = {
-                "sharpe_ratio": self._sanitize_value(stats_dict.get("Sharpe Ratio", 0)),
-                "sortino_ratio": self._sanitize_value(
-                    stats_dict.get("Sortino Ratio", 0)
-                ),
-                "profit_factor": self._sanitize_value(
-                    stats_dict.get("Profit Factor", 0)
-                ),
-                "calmar_ratio": self._sanitize_value(stats_dict.get("Calmar Ratio", 0)),
-                "max_drawdown": self._sanitize_value(
-                    stats_dict.get("Max. Drawdown [%]", 0)
-                ),
-                "return": self._sanitize_value(stats_dict.get("Return [%]", 0)),
-                "ulcer_index": self._sanitize_value(stats_dict.get("Ulcer Index", 0.0)),
-                "k_ratio": self._sanitize_value(stats_dict.get("K-Ratio", 0.0)),
-                "tail_ratio": self._sanitize_value(stats_dict.get("Tail Ratio", 0.0)),
-                "expectancy": self._sanitize_value(stats_dict.get("Expectancy", 0.0)),
-                "roe": self._sanitize_value(stats_dict.get("Return on Equity", 0.0)),
-                "time_to_recover": self._sanitize_value(
-                    stats_dict.get("Time to Recover", 0.0)
+            backtest_id = self.db.execute_query(
+                "INSERT OR REPLACE INTO backtest_backtests (strategy_id, symbol_id, timeframe, metrics, timestamp) VALUES (?, ?, ?, ?, ?)",
+                (
+                    strategy_id,
+                    symbol_id,
+                    tf_str,
+                    json.dumps(metrics),
+                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 ),
-            }
+            ).lastrowid
+            self.logger.info(
+                "Backtest completed for %s with %s: %s",
+                symbol,
+                strategy_name,
+                metrics,
+            )
+
+            # Save optimal parameters (update to use symbol_id)
+            param_values = (
+                symbol_id,
+                tf_str,
+                strategy_name,
+                json.dumps(best_params),
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            )
+            self.db.execute_query(
+                "INSERT OR REPLACE INTO optimal_parameters (symbol_id, timeframe, strategy_name, parameter_value, last_optimized) VALUES (?, ?, ?, ?, ?)",
+                param_values,
+            )
+
+        # Extract and store individual trades from backtest results; they get a
+        # transaction (a savepoint inside _store_backtest_results) of their own,
+        # so a trade-level failure cannot roll back the metrics
+        self._extract_and_store_trades(best_stats, backtest_id, symbol_id)
+        return True
+
+    def _build_param_grid(self, strategy_name, params, opt_params, max_combos=None):
+        """Build the parameter combinations to evaluate for a strategy.
+
+        Each optimizable parameter takes its candidate list from ``opt_params``,
+        falling back to the strategy's configured value (or the grid default).
+        The Cartesian product is consumed lazily, skips fast/slow pairs where
+        the fast period is not shorter, and is capped at ``max_combos``.
+
+        Args:
+            strategy_name: Strategy name (case-insensitive)
+            params: Strategy parameters from config
+            opt_params: Candidate values per parameter from backtesting.optimization
+            max_combos: Optional upper bound on the number of combinations
+
+        Returns:
+            List of parameter dictionaries, each including ``volume``
+        """
+        grid = OPTIMIZATION_GRIDS.get(strategy_name.lower(), DEFAULT_OPTIMIZATION_GRID)
+        keys = [key for key, _ in grid]
+        candidates = [
+            opt_params.get(key, [params.get(key, default)]) for key, default in grid
+        ]
+        volume = params.get("volume", 0.01)
+
+        combos = product(*candidates)
+        if "fast_period" in keys and "slow_period" in keys:
+            fast, slow = keys.index("fast_period"), keys.index("slow_period")
+            # A fast period at or above the slow one can never produce a
+            # meaningful crossover, so those combinations are not run at all
+            combos = (combo for combo in combos if combo[fast] < combo[slow])
+
+        limit = max_combos + 1 if max_combos else None
+        param_dicts = [
+            {**dict(zip(keys, combo)), "volume": volume}
+            for combo in islice(combos, limit)
+        ]
+        if max_combos and len(param_dicts) > max_combos:
+            self.logger.warning(
+                "%s grid exceeds %d combinations (max_combos); evaluating the first %d",
+                strategy_name,
+                max_combos,
+                max_combos,
+            )
+            param_dicts = param_dicts[:max_combos]
+        return param_dicts
+
+    def _run_param_grid(self, data, strategy_class, param_dicts, cache_context=None):
+        """Run every parameter combination, reusing cached stats when available.
+
+        Args:
+            data: OHLCV DataFrame to backtest on
+            strategy_class: backtesting.py Strategy subclass
+            param_dicts: List of parameter dictionaries to evaluate
+            cache_context: Optional dict identifying the run (symbol, timeframe,
+                strategy, data hash, code version); None disables the disk cache
+
+        Returns:
+            List of (param_dict, stats) tuples for successful runs, in the
+            order of ``param_dicts``
+        """
+        keys = [
+            self._stats_cache_key(cache_context, param_dict) if cache_context else None
+            for param_dict in param_dicts
+        ]
+        cached = [self._load_cached_stats(key) if key else None for key in keys]
+        pending = [p for p, stats in zip(param_dicts, cached) if stats is None]
+        if cache_context and len(pending) < len(param_dicts):
+            self.logger.info(
+                "Reusing %d/%d cached backtest results",
+                len(param_dicts) - len(pending),
+                len(param_dicts),
+            )
+
+        fresh = {
+            id(param_dict): stats
+            for param_dict, stats in self._execute_param_grid(
+                data, strategy_class, pending
+            )
+        }
+
+        results = []
+        for param_dict, key, stats in zip(param_dicts, keys, cached):
+            if stats is None:
+                stats = fresh.get(id(param_dict))
+                if stats is None:
+                    continue
+                if key:
+                    self._store_cached_stats(key, stats)
+            results.append((param_dict, stats))
+        return results
+
+    def _execute_param_grid(self, data, strategy_class, param_dicts):
+        """Run parameter combinations, fanning out across processes.
+
+        Combinations are independent and CPU-bound, so they are spread over a
+        process pool sized by ``backtesting.max_workers`` (defaults to the CPU
+        count) in contiguous slices. Single-combination grids and
+        ``max_workers: 1`` run serially. Results keep the order of
+        ``param_dicts`` so best-run selection is unchanged; failed
+        combinations are logged and skipped.
+
+        Args:
+            data: OHLCV DataFrame to backtest on
+            strategy_class: backtesting.py Strategy subclass
+            param_dicts: List of parameter dictionaries to evaluate
+
+        Returns:
+            List of (param_dict, stats) tuples for successful runs
+        """
+        max_workers = self.config.get("backtesting", {}).get("max_workers")
+        results = []
+
+        if len(param_dicts) <= 1 or max_workers == 1:
+            if not param_dicts:
+                return results
             try:
-                # Ensure strategy exists in backtest_strategies table
-                existing_strat = self.db.execute_query(
-                    "SELECT id FROM backtest_strategies WHERE name = ? LIMIT 1",
-                    (strategy_name.lower(),),
-                ).fetchall()
-                if existing_strat:
-                    strategy_id = existing_strat[0][0]
-                else:
-                    # Insert strategy if it doesn't exist
-                    self.db.execute_query(
-                        "INSERT INTO backtest_strategies (name) VALUES (?)",
-                        (strategy_name.lower(),),
-                    )
-                    result = self.db.execute_query(
-                        "SELECT id FROM backtest_strategies WHERE name = ? LIMIT 1",
-                        (strategy_name.lower(),),
-                    ).fetchall()
-                    strategy_id = result[0][0]
-
-                # Get symbol_id from tradable_pairs
-                symbol_id_result = self.db.execute_query(
-                    "SELECT id FROM tradable_pairs WHERE symbol = ?",
-                    (symbol,),
-                ).fetchall()
-                if not symbol_id_result:
-                    self.logger.error("Symbol %s not found in tradable_pairs", symbol)
-                    return
-                symbol_id = symbol_id_result[0][0]
-
-                # Calculate rank_score from metrics
-                sharpe = metrics.get("sharpe_ratio", 0)
-                profit_factor = metrics.get("profit_factor", 0)
-                max_dd = (
-                    abs(metrics.get("max_drawdown", 0))
-                    if metrics.get("max_drawdown")
-                    else 0
-                )
+                bt = _make_grid_backtest(data, strategy_class)
+            except Exception as exc:
+                ErrorHandler.handle_error(exc, context="backtest_run")
+                return results
+            try:
+                for param_dict in param_dicts:
+                    try:
+                        stats = _run_param_combination(param_dict, bt)
+                        results.append((param_dict, stats))
+                    except Exception as exc:
+                        ErrorHandler.handle_error(exc, context="backtest_run")
+            finally:
+                # Indicator lines are only shared within one grid; pool
+                # workers drop theirs when the pool shuts down
+                clear_indicator_cache()
+            return results
+
+        workers = max_workers or os.cpu_count() or 1
+        # Grids are ordered indicator-period first, so contiguous slices keep
+        # combinations sharing indicator lines on one worker and its memoized
+        # kernels compute each line once
+        chunk_size = max(1, math.ceil(len(param_dicts) / (workers * 4)))
+        chunks = [
+            param_dicts[i : i + chunk_size]
+            for i in range(0, len(param_dicts), chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_grid_worker,
+            initargs=(data, strategy_class),
+        ) as executor:
+            futures = [executor.submit(_run_param_chunk, chunk) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    outcomes = future.result()
+                except Exception as exc:
+                    ErrorHandler.handle_error(exc, context="backtest_run")
+                    continue
+                for param_dict, outcome in zip(chunk, outcomes):
+                    if isinstance(outcome, Exception):
+                        ErrorHandler.handle_error(outcome, context="backtest_run")
+                    else:
+                        results.append((param_dict, outcome))
+        return results
 
-                # Simple rank score: higher sharpe, higher profit factor, lower drawdown
-                rank_score = (
-                    (sharpe / 10.0 if sharpe != 0 else 0)
-                    + (min(profit_factor / 5.0, 1.0) if profit_factor != 0 else 0)
-                    - (max_dd * 10 if max_dd != 0 else 0)
-                )
-                rank_score = max(0, min(1.0, rank_score))  # Clamp to 0-1
-                metrics["rank_score"] = rank_score
-
-                self.db.execute_query(
-                    "INSERT OR REPLACE INTO backtest_backtests (strategy_id, symbol_id, timeframe, metrics, timestamp) VALUES (?, ?, ?, ?, ?)",
-                    (
-                        strategy_id,
-                        symbol_id,
-                        tf_str,
-                        json.dumps(metrics),
-                        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    ),
-                )
-                self.logger.info(
-                    "Backtest completed for %s with %s: %s",
-                    symbol,
-                    strategy_name,
-                    metrics,
-                )
+    @staticmethod
+    def _rank_scores(metrics_rows):
+        """Compute rank scores for a batch of backtest metrics in one pass.
 
-                # Save optimal parameters (update to use symbol_id)
-                param_values = (
-                    symbol_id,
-                    tf_str,
-                    strategy_name,
-                    json.dumps(best_params),
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                )
-                self.db.execute_query(
-                    "INSERT OR REPLACE INTO optimal_parameters (symbol_id, timeframe, strategy_name, parameter_value, last_optimized) VALUES (?, ?, ?, ?, ?)",
-                    param_values,
-                )
+        Higher Sharpe and profit factor raise the score, drawdown lowers it:
+        ``sharpe / 10 + min(profit_factor / 5, 1) - |max_drawdown| * 10``,
+        clamped to [0, 1].
+
+        Args:
+            metrics_rows: Iterable of sanitized metrics dictionaries
 
-                # Extract and store individual trades from backtest results
-                self._extract_and_store_trades(
-                    best_stats, symbol_id, strategy_id, tf_str, best_params
+        Returns:
+            float64 array with one score per row
+        """
+        arr = np.array(
+            [
+                (
+                    row.get("sharpe_ratio", 0),
+                    row.get("profit_factor", 0),
+                    row.get("max_drawdown", 0),
                 )
+                for row in metrics_rows
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        scores = (
+            arr[:, 0] / 10.0 + np.minimum(arr[:, 1] / 5.0, 1.0) - np.abs(arr[:, 2]) * 10
+        )
+        return np.clip(scores, 0.0, 1.0)
 
-            except Exception as exc:
-                ErrorHandler.handle_error(exc, context="save_backtest_results")
+    @staticmethod
+    def _hash_data(data):
+        """Return a SHA-256 digest of an OHLCV DataFrame including its index.
+
+        Hashes the raw column buffers directly (plus column names and dtypes)
+        rather than going through ``pd.util.hash_pandas_object``, which first
+        builds a per-row uint64 hash array.
+
+        Args:
+            data: OHLCV DataFrame
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(data.index.to_numpy()).view(np.uint8))
+        for name in data.columns:
+            values = np.ascontiguousarray(data[name].to_numpy())
+            digest.update(f"{name}:{values.dtype.str}".encode())
+            digest.update(values.view(np.uint8))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _stats_cache_key(cache_context, param_dict):
+        """Build the cache key for one parameter combination.
+
+        Args:
+            cache_context: Dict identifying symbol, timeframe, strategy, data and
+                code version
+            param_dict: Strategy parameters for the run
+
+        Returns:
+            Hex digest string
+        """
+        payload = json.dumps(
+            {**cache_context, "params": param_dict}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _load_cached_stats(self, key):
+        """Load cached backtest stats, treating unreadable entries as misses.
+
+        Args:
+            key: Cache key from _stats_cache_key()
+
+        Returns:
+            Stats object, or None if not cached
+        """
+        path = self._cache_dir / f"{key}.pkl"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError) as exc:
+            self.logger.debug("Ignoring unreadable backtest cache %s: %s", path, exc)
+            return None
+
+    def _store_cached_stats(self, key, stats):
+        """Persist backtest stats to the disk cache.
+
+        Args:
+            key: Cache key from _stats_cache_key()
+            stats: Stats object returned by Backtest.run()
+        """
+        path = self._cache_dir / f"{key}.pkl"
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(stats, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError) as exc:
+            self.logger.debug("Could not write backtest cache %s: %s", path, exc)
+
+    def _get_prepared_data(self, symbol, tf_str, start_date, end_date):
+        """Return backtest data for a window, reusing frames loaded this session.
+
+        Backtesting never mutates the frame (FractionalBacktest works on a
+        shallow copy), so the same DataFrame is shared by every strategy run
+        on that symbol and timeframe.
+
+        Args:
+            symbol: Trading symbol
+            tf_str: Timeframe string (e.g., 'M15', 'H1')
+            start_date: Window start date
+            end_date: Window end date
+
+        Returns:
+            Prepared OHLCV DataFrame, or None if no data is available
+        """
+        key = (symbol, tf_str, start_date, end_date)
+        data = self._data_cache.get(key)
+        if data is not None:
+            self._data_cache.move_to_end(key)
+            return data
+
+        data = self._data_handler.prepare_backtest_data(
+            symbol, tf_str, start_date, end_date
+        )
+        if data is not None and not data.empty:
+            self._data_cache[key] = data
+            if len(self._data_cache) > DATA_CACHE_SIZE:
+                self._data_cache.popitem(last=False)
+        return data
 
-            # Note: Equity curve plotting removed per user request - only terminal progress required
-            # Files would be saved to: backtests/results/equity_curve_{symbol}_{strategy_name}.html
-            # View results in web dashboard instead: http://127.0.0.1:5000/backtest
+    def clear_data_cache(self):
+        """Drop cached backtest data, e.g. after market_data has been synced."""
+        self._data_cache.clear()
 
-            # Generate optimization heatmap (for RSI only, as example)
-            # Note: Heatmap generation removed per user request - only terminal progress required
+    def _get_strategy_id(self, strategy_name):
+        """Return the backtest_strategies id for a strategy, creating it if needed.
+
+        Args:
+            strategy_name: Strategy name (case-insensitive)
+
+        Returns:
+            Integer strategy id
+        """
+        name = strategy_name.lower()
+        strategy_id = self._strategy_ids.get(name)
+        if strategy_id is not None:
+            return strategy_id
+
+        if SQLITE_HAS_RETURNING:
+            # Upsert and read the id back in one statement; the row must be
+            # fetched before the commit, hence the explicit transaction
+            with self.db.transaction():
+                row = self.db.execute_query(
+                    "INSERT INTO backtest_strategies (name) VALUES (?) "
+                    "ON CONFLICT(name) DO UPDATE SET name = excluded.name "
+                    "RETURNING id",
+                    (name,),
+                ).fetchone()
+        else:
+            self.db.execute_query(
+                "INSERT OR IGNORE INTO backtest_strategies (name) VALUES (?)", (name,)
+            )
+            row = self.db.execute_query(
+                "SELECT id FROM backtest_strategies WHERE name = ? LIMIT 1", (name,)
+            ).fetchone()
+        strategy_id = self._strategy_ids[name] = row[0]
+        return strategy_id
+
+    def _get_symbol_id(self, symbol):
+        """Return the tradable_pairs id for a symbol, querying only on a miss.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Integer symbol id, or None if the symbol is not a tradable pair
+        """
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            row = self.db.execute_query(
+                "SELECT id FROM tradable_pairs WHERE symbol = ?", (symbol,)
+            ).fetchone()
+            if row is None:
+                return None
+            symbol_id = self._symbol_ids[symbol] = row[0]
+        return symbol_id
 
     def optimize(self, symbol, strategy_name, start_date=None, end_date=None):
         """Alias for run_backtest() - runs parameter optimization via backtest.
@@ -481,7 +1038,7 @@ class BacktestManager:
     def run_multi_backtest(
         self, symbols, strategy_name, start_date=None, end_date=None
     ):
-        """Run backtests for multiple symbols & timeframes sequentially.
+        """Run backtests for multiple symbols & timeframes, in parallel when possible.
 
         Args:
             symbols: List of symbol strings (e.g., ['BTCUSD', 'ETHUSD', 'XRPUSD']).
@@ -500,41 +1057,22 @@ class BacktestManager:
         # Get unique timeframes from config
         timeframes = self.config.get("timeframes", [15, 60, 240])
 
-        # Create symbol_timeframes mapping using all symbols with all timeframes
-        symbol_timeframes = {}
-        for symbol in symbols:
-            symbol_timeframes[symbol] = timeframes
-
-        total_tests = sum(len(tfs) for tfs in symbol_timeframes.values())
+        # Every symbol is tested on all configured timeframes
+        tasks = [
+            (symbol, strategy_name, timeframe)
+            for symbol in symbols
+            for timeframe in sorted(timeframes)
+        ]
         self.logger.info(
             "Starting multi-backtest for %d symbols across %d timeframes with strategy %s",
             len(symbols),
-            total_tests,
+            len(tasks),
             strategy_name,
         )
+        if not tasks:
+            self.logger.warning("No configured timeframes found for multi-backtest")
 
-        all_results = {}
-        test_count = 0
-        for symbol in symbols:
-            timeframes = symbol_timeframes.get(symbol, [])
-            if not timeframes:
-                self.logger.warning("No configured timeframes found for %s", symbol)
-                continue
-
-            for timeframe in sorted(timeframes):
-                tf_str = f"M{timeframe}" if timeframe < 60 else f"H{timeframe//60}"
-                self.logger.info(
-                    "Backtesting %s (%s) [%d/%d]...",
-                    symbol,
-                    tf_str,
-                    test_count + 1,
-                    total_tests,
-                )
-                self.run_backtest(
-                    symbol, strategy_name, start_date, end_date, timeframe=timeframe
-                )
-                all_results[f"{symbol}_{tf_str}"] = True
-                test_count += 1
+        test_count = self._execute_backtest_tasks(tasks, start_date, end_date)
 
         self.logger.info(
             "Multi-backtest completed: %d tests across %d symbols",
@@ -560,6 +1098,121 @@ class BacktestManager:
         self.logger.info("     Navigate to: http://127.0.0.1:5000")
         self.logger.info("=" * 80)
 
+    def _execute_backtest_tasks(self, tasks, start_date, end_date):
+        """Run (symbol, strategy, timeframe) backtests, fanning out across processes.
+
+        Tasks are independent, so with more than one task they are spread over
+        a process pool sized by ``backtesting.max_workers`` (defaults to the
+        CPU count). Workers only read; their best runs are written here in one
+        transaction, so this process is the database's only writer. In-memory
+        databases and ``max_workers: 1`` run serially on this manager.
+
+        Args:
+            tasks: List of (symbol, strategy_name, timeframe) tuples
+            start_date: Optional start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+
+        Returns:
+            Number of completed backtests whose results, if any, were stored
+        """
+        backtesting_config = self.config.get("backtesting", {})
+        max_workers = backtesting_config.get("max_workers")
+        total = len(tasks)
+        progress_bar = tqdm(total=total, desc="Backtesting", unit="test")
+
+        if total <= 1 or max_workers == 1 or self.db.db_path == ":memory:":
+            for count, (symbol, strategy_name, timeframe) in enumerate(tasks, 1):
+                self.logger.info(
+                    "Backtesting %s %s (%s) [%d/%d]...",
+                    strategy_name,
+                    symbol,
+                    self._timeframe_label(timeframe),
+                    count,
+                    total,
+                )
+                self._run_single_backtest(
+                    symbol, strategy_name, start_date, end_date, timeframe
+                )
+                progress_bar.update(1)
+            progress_bar.close()
+            return total
+
+        # Workers build their own managers from the config, so carry over
+        # settings changed on this instance (e.g. --cache)
+        config = {
+            **self.config,
+            "backtesting": {**backtesting_config, "cache": self.use_cache},
+        }
+        completed = 0
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=min(total, max_workers or os.cpu_count() or 1)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_backtest_task,
+                    config,
+                    symbol,
+                    strategy_name,
+                    start_date,
+                    end_date,
+                    timeframe,
+                )
+                for symbol, strategy_name, timeframe in tasks
+            ]
+            for future in as_completed(futures):
+                progress_bar.update(1)
+                try:
+                    symbol, strategy_name, timeframe, result = future.result()
+                except Exception as exc:
+                    ErrorHandler.handle_error(exc, context="backtest_run")
+                    continue
+                if result is not None:
+                    results.append(result)
+                completed += 1
+                self.logger.info(
+                    "Backtested %s %s (%s) [%d/%d]",
+                    strategy_name,
+                    symbol,
+                    self._timeframe_label(timeframe),
+                    completed,
+                    total,
+                )
+        progress_bar.close()
+        return completed - (len(results) - self._store_backtest_results(results))
+
+    def _store_backtest_results(self, results):
+        """Write the best runs of pooled backtests in a single transaction.
+
+        Any failure rolls back the whole batch and is reported, so a run never
+        counts results it did not store.
+
+        Args:
+            results: List of _compute_single_backtest() tuples
+
+        Returns:
+            Number of results stored
+        """
+        try:
+            # Resolved before the transaction so a rollback never leaves a
+            # cached id pointing at an uncommitted row
+            for _, strategy_name, *_ in results:
+                self._get_strategy_id(strategy_name)
+            with self.db.transaction():
+                stored = [self._save_backtest_results(*result) for result in results]
+        except Exception as exc:
+            ErrorHandler.handle_error(exc, context="save_backtest_results")
+            return 0
+        return sum(stored)
+
+    @staticmethod
+    def _timeframe_label(timeframe):
+        """Return the M/H label for a timeframe in minutes (e.g. 15 -> 'M15')."""
+        label = TIMEFRAME_LABELS.get(timeframe)
+        if label is None:
+            label = f"M{timeframe}" if timeframe < 60 else f"H{timeframe//60}"
+        return label
+
     def generate_multi_backtest_report(self, symbols, strategy_name):
         """Generate comparison report for multi-symbol backtests.
 
@@ -571,32 +1224,40 @@ class BacktestManager:
             None. Report saved to backtests/results/ directory.
         """
         try:
-            # Get all results for each symbol & timeframe combination
-            all_metrics = []
-            for symbol in symbols:
-                query = """
-                    SELECT symbol, timeframe, metrics, timestamp 
+            # Most recent result per (symbol, timeframe) for all symbols at once
+            placeholders = ", ".join("?" for _ in symbols)
+            query = f"""
+                SELECT symbol, timeframe, metrics FROM (
+                    SELECT tp.symbol AS symbol, b.timeframe AS timeframe,
+                           b.metrics AS metrics, b.timestamp AS timestamp,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY tp.symbol, b.timeframe
+                               ORDER BY b.timestamp DESC
+                           ) AS rn
                     FROM backtest_backtests b
                     JOIN backtest_strategies s ON b.strategy_id = s.id
-                    WHERE s.name = ? AND b.symbol = ?
-                    ORDER BY b.timestamp DESC
-                """
-                results = self.db.execute_query(query, (strategy_name.lower(), symbol))
-
-                # Get most recent result for each timeframe
-                seen_timeframes = set()
-                for result in results:
-                    tf = result["timeframe"]
-                    if tf not in seen_timeframes:
-                        metrics = json.loads(result["metrics"])
-                        all_metrics.append(
-                            {
-                                "symbol": symbol,
-                                "timeframe": tf,
-                                **metrics,
-                            }
-                        )
-                        seen_timeframes.add(tf)
+                    JOIN tradable_pairs tp ON b.symbol_id = tp.id
+                    WHERE s.name = ? AND tp.symbol IN ({placeholders})
+                )
+                WHERE rn = 1
+                ORDER BY timestamp DESC
+            """
+            rows = self.db.execute_query(
+                query, (strategy_name.lower(), *symbols)
+            ).fetchall()
+            by_symbol = {}
+            for row in rows:
+                by_symbol.setdefault(row["symbol"], []).append(
+                    {
+                        "symbol": row["symbol"],
+                        "timeframe": row["timeframe"],
+                        **json.loads(row["metrics"]),
+                    }
+                )
+            # Keep the caller's symbol order in the report
+            all_metrics = [
+                entry for symbol in symbols for entry in by_symbol.get(symbol, [])
+            ]
 
             # Create comparison dataframe
             if all_metrics:
@@ -628,35 +1289,54 @@ class BacktestManager:
         Returns:
             None. Heatmap saved to backtests/results/ directory.
         """
+        # Imported here so pool workers, which re-import this module, do not
+        # load matplotlib just to run backtests
+        from matplotlib.figure import Figure
+
         try:
-            periods = sorted(set(p["period"] for p, _ in results))
-            oversolds = sorted(set(p["oversold"] for p, _ in results))
-            heatmap_data = np.zeros((len(oversolds), len(periods)))
-            for i, oversold in enumerate(oversolds):
-                for j, period in enumerate(periods):
-                    for params, stats in results:
-                        if (
-                            params["period"] == period
-                            and params["oversold"] == oversold
-                        ):
-                            heatmap_data[i, j] = stats["Sharpe Ratio"]
-
-            plt.figure(figsize=(10, 8))
-            plt.imshow(heatmap_data, cmap="viridis", interpolation="nearest")
-            plt.colorbar(label="Sharpe Ratio")
-            plt.xticks(np.arange(len(periods)), periods)
-            plt.yticks(np.arange(len(oversolds)), oversolds)
-            plt.xlabel("RSI Period")
-            plt.ylabel("Oversold Threshold")
-            plt.title(f"RSI Optimization Heatmap - {symbol} ({timeframe})")
-            heatmap_file = (
-                f"backtests/results/rsi_optimization_heatmap_{symbol}_{timeframe}.html"
+            rows = pd.DataFrame(
+                [
+                    {
+                        "period": params["period"],
+                        "oversold": params["oversold"],
+                        "sharpe": stats["Sharpe Ratio"],
+                    }
+                    for params, stats in results
+                ]
             )
-            plt.savefig(heatmap_file.replace(".html", ".png"))
-            plt.close()
-            self.logger.info(
-                "Saved heatmap to %s", heatmap_file.replace(".html", ".png")
+            # Later runs win on duplicate cells; combinations missing from the
+            # grid are plotted as 0, while NaN Sharpe values (e.g. no trades)
+            # stay NaN so imshow leaves them blank
+            sharpe = rows.drop_duplicates(
+                ["oversold", "period"], keep="last"
+            ).set_index(["oversold", "period"])["sharpe"]
+            cells = pd.MultiIndex.from_product(
+                [np.sort(rows["oversold"].unique()), np.sort(rows["period"].unique())],
+                names=["oversold", "period"],
+            )
+            heatmap = sharpe.reindex(cells, fill_value=0.0).unstack("period")
+
+            # A standalone Figure skips pyplot's global figure registry, so
+            # nothing is left open if rendering fails
+            fig = Figure(figsize=(10, 8))
+            ax = fig.add_subplot()
+            image = ax.imshow(
+                heatmap.to_numpy(), cmap="viridis", interpolation="nearest"
+            )
+            fig.colorbar(image, ax=ax, label="Sharpe Ratio")
+            ax.set_xticks(np.arange(len(heatmap.columns)))
+            ax.set_xticklabels(heatmap.columns)
+            ax.set_yticks(np.arange(len(heatmap.index)))
+            ax.set_yticklabels(heatmap.index)
+            ax.set_xlabel("RSI Period")
+            ax.set_ylabel("Oversold Threshold")
+            ax.set_title(f"RSI Optimization Heatmap - {symbol} ({timeframe})")
+            # PNG is what the web dashboard serves for optimization heatmaps
+            heatmap_file = (
+                f"backtests/results/rsi_optimization_heatmap_{symbol}_{timeframe}.png"
             )
+            fig.savefig(heatmap_file)
+            self.logger.info("Saved heatmap to %s", heatmap_file)
         except Exception as exc:
             ErrorHandler.handle_error(exc, context="generate_heatmap")
 
@@ -698,7 +1378,22 @@ class BacktestManager:
             default=None,
             help="Backtest end date (YYYY-MM-DD format). Falls back to config if not provided.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes for backtests and parameter grids (1 = serial). Defaults to backtesting.max_workers or the CPU count",
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Reuse per-combination results cached in backtests/cache (pickles; only use a trusted directory)",
+        )
         args = parser.parse_args()
+        if args.cache:
+            self.use_cache = True
+        if args.workers is not None:
+            self.config.setdefault("backtesting", {})["max_workers"] = args.workers
 
         if args.mode == "sync":
             self.sync(args.symbol)
@@ -743,17 +1438,13 @@ class BacktestManager:
             else:
                 self.sync(args.symbol)
 
-    def _extract_and_store_trades(
-        self, stats, symbol_id, strategy_id, timeframe, params
-    ):
+    def _extract_and_store_trades(self, stats, backtest_id, symbol_id):
         """Extract individual trades from backtest stats and store in database.
 
         Args:
             stats: Stats object from backtesting.py
+            backtest_id: ID of the run in backtest_backtests table
             symbol_id: ID of symbol in tradable_pairs table
-            strategy_id: ID of strategy in backtest_strategies table
-            timeframe: Timeframe string (e.g., 'M15', 'H1')
-            params: Parameters used for the backtest
         """
         try:
             # Extract trades using TradeExtractor
@@ -765,40 +1456,63 @@ class BacktestManager:
             # Calculate trade statistics
             trade_stats = TradeExtractor.calculate_trade_statistics(trades_df)
 
-            # Store each trade in database
-            for _, trade in trades_df.iterrows():
+            missing = [col for col in TRADE_COLUMNS if col not in trades_df.columns]
+            if missing:
+                self.logger.warning(
+                    "Trades for backtest %s lack columns %s; not stored",
+                    backtest_id,
+                    missing,
+                )
+                return
+
+            # Build every row first, then store them with one executemany
+            rows = []
+            for (
+                entry_time,
+                exit_time,
+                entry_price,
+                exit_price,
+                size,
+                pnl,
+                pnl_pct,
+                duration_hours,
+            ) in trades_df[TRADE_COLUMNS].itertuples(index=False, name=None):
                 try:
-                    self.db.execute_query(
-                        """INSERT OR REPLACE INTO backtest_trades 
-                           (strategy_id, symbol_id, timeframe, entry_time, exit_time, 
-                            entry_price, exit_price, size, pnl, pnl_pct, duration_hours, 
-                            params, created_at)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    rows.append(
                         (
-                            strategy_id,
+                            backtest_id,
+                            str(entry_time),
+                            str(exit_time),
                             symbol_id,
-                            timeframe,
-                            str(trade["entry_time"]),
-                            str(trade["exit_time"]),
-                            float(trade["entry_price"]),
-                            float(trade["exit_price"]),
-                            float(trade["size"]),
-                            float(trade["pnl"]),
-                            float(trade["pnl_pct"]),
-                            float(trade["duration_hours"]),
-                            json.dumps(params),
-                            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        ),
+                            float(entry_price),
+                            float(exit_price),
+                            float(size),
+                            float(pnl),
+                            float(pnl_pct),
+                            float(duration_hours),
+                        )
                     )
-                except (KeyError, TypeError, ValueError) as e:
+                except (TypeError, ValueError) as e:
                     self.logger.warning(
-                        f"Failed to store trade for {symbol_id}/{strategy_id}: {e}"
+                        f"Failed to store trade for backtest {backtest_id}: {e}"
                     )
                     continue
 
+            # Own transaction (a savepoint when the caller already holds one) so
+            # a failed batch leaves no partial trade list
+            with self.db.transaction():
+                self.db.execute_many(
+                    """INSERT INTO backtest_trades
+                       (backtest_backtest_id, entry_time, exit_time, symbol_id,
+                        entry_price, exit_price, volume, profit, profit_pct,
+                        duration_hours)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    rows,
+                )
+
             self.logger.info(
-                f"Stored {len(trades_df)} trades for strategy {strategy_id}, "
-                f"symbol {symbol_id}, timeframe {timeframe}"
+                f"Stored {len(rows)} trades for backtest {backtest_id}, "
+                f"symbol {symbol_id}"
             )
 
             # Log trade statistics summary
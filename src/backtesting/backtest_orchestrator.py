@@ -1,7 +1,7 @@
 # src/backtesting/backtest_orchestrator.py
 # Purpose: Orchestrates backtesting with metrics and trade logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -32,6 +32,9 @@ class BacktestOrchestrator:
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.returns: Optional[pd.Series] = None
+        # Last calculate_metrics() result and the trades/returns it was built from
+        self._metrics: Optional[Dict[str, float]] = None
+        self._metrics_source: Optional[Tuple[TradeLogger, int, pd.Series, int]] = None
 
         self.logger.debug(
             "Initialized BacktestOrchestrator for %s (%s, %s)",
@@ -92,6 +95,11 @@ class BacktestOrchestrator:
     def calculate_metrics(self) -> Dict[str, float]:
         """Calculate all 15 metrics from trades and returns.
 
+        The result is reused while the trade count and the returns series
+        are unchanged, so summary and results calls on the same backtest
+        compute it once. Trades logged on ``trade_logger`` directly or a
+        reassigned ``returns`` are picked up as well.
+
         Returns:
             Dictionary with all metrics
         """
@@ -99,15 +107,40 @@ class BacktestOrchestrator:
             self.logger.warning("Returns not set, cannot calculate metrics")
             return {}
 
-        trades = self.trade_logger.get_trades()
-        metrics = self.metrics_engine.calculate_all_metrics(trades, self.returns)
+        if not self._metrics_current():
+            self._metrics_source = (
+                self.trade_logger,
+                self.trade_logger.get_trade_count(),
+                self.returns,
+                len(self.returns),
+            )
+            self._metrics = self.metrics_engine.calculate_metrics_from_arrays(
+                self.trade_logger.get_column("profit"),
+                self.trade_logger.get_column("profit_pct"),
+                self.returns,
+            )
+            self.logger.info(
+                "Calculated %d metrics for %s",
+                len(self._metrics),
+                self.symbol,
+            )
+        return dict(self._metrics)
+
+    def _metrics_current(self) -> bool:
+        """Check the cached metrics still match the trades and returns.
 
-        self.logger.info(
-            "Calculated %d metrics for %s",
-            len(metrics),
-            self.symbol,
+        Returns:
+            True if the cached metrics can be reused, False otherwise
+        """
+        if self._metrics is None or self._metrics_source is None:
+            return False
+        trade_logger, trade_count, returns, returns_length = self._metrics_source
+        return (
+            trade_logger is self.trade_logger
+            and trade_count == self.trade_logger.get_trade_count()
+            and returns is self.returns
+            and returns_length == len(self.returns)
         )
-        return metrics
 
     def get_results_dict(self) -> Dict:
         """Get complete backtest results as dictionary.
@@ -1,19 +1,42 @@
 # src/backtesting/metrics_engine.py
 # Purpose: Calculate 15 comprehensive metrics for backtest results
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-import empyrical as ep
+import numpy as np
 import pandas as pd
 
+from src.backtesting.metrics_kernels import trade_pct_summary
 from src.utils.logging_factory import LoggingFactory
 
+# Periods per year for the daily return series
+TRADING_DAYS = 252
+
+# Metrics of a run without trades, in output order. The return-based ratios
+# are overwritten from the returns series; every trade statistic stays zero.
+_NO_TRADE_METRICS = {
+    "total_profit_pct": 0.0,
+    "sharpe_ratio": 0.0,
+    "annual_return_pct": 0.0,
+    "max_drawdown_pct": 0.0,
+    "profit_factor": 0.0,
+    "total_orders": 0,
+    "win_rate_pct": 0.0,
+    "pl_ratio": 0.0,
+    "winner_avg_pct": 0.0,
+    "loser_avg_pct": 0.0,
+    "sortino_ratio": 0.0,
+    "calmar_ratio": 0.0,
+    "recovery_factor": 0.0,
+}
+
 
 class MetricsEngine:
     """Calculate 15 comprehensive backtesting metrics.
 
     Provides methods to compute core metrics (Sharpe, drawdown, profit factor),
     trade statistics (win rate, P/L ratio), and bonus metrics (Sortino, Calmar).
-    Uses empyrical library for accurate financial calculations.
+    Return-based ratios follow empyrical's definitions, computed directly on
+    the NumPy returns array.
     """
 
     def __init__(self):
@@ -34,26 +57,74 @@ class MetricsEngine:
         Returns:
             Dictionary with all 15 metrics
         """
+        return self.calculate_metrics_from_arrays(
+            self._trade_values(trades, "profit"),
+            self._trade_values(trades, "profit_pct"),
+            returns,
+        )
+
+    def calculate_metrics_from_arrays(
+        self,
+        profits: np.ndarray,
+        profit_pcts: np.ndarray,
+        returns: pd.Series,
+    ) -> Dict[str, float]:
+        """Calculate all 15 metrics from per-trade arrays and returns.
+
+        Args:
+            profits: Per-trade profit values
+            profit_pcts: Per-trade profit percentages, aligned with profits
+            returns: Series of daily returns (index=date, values=returns)
+
+        Returns:
+            Dictionary with all 15 metrics
+        """
+        # The ratio helpers work on the plain returns array and the win/loss
+        # statistics all read one fused pass over the profit percentages
+        daily = returns.to_numpy(dtype=np.float64)
+        # Drawdown and growth rate feed several metrics, so derive each once;
+        # None marks a series too short for return-based metrics
+        if daily.size >= 2:
+            max_dd = self._max_drawdown(daily)
+            cagr = self._cagr(daily)
+        else:
+            max_dd = cagr = None
+
+        if len(profits) == 0:
+            # Common in parameter sweeps: skip the per-trade statistics and
+            # only fill in the ratios that depend on returns
+            metrics = dict(_NO_TRADE_METRICS)
+            metrics["sharpe_ratio"] = self._sharpe_ratio(daily)
+            metrics["annual_return_pct"] = self._annual_return_pct(cagr)
+            metrics["max_drawdown_pct"] = self._max_drawdown_pct(max_dd)
+            metrics["sortino_ratio"] = self._sortino_ratio(daily)
+            metrics["calmar_ratio"] = self._calmar_ratio(cagr, max_dd)
+            self.logger.debug("Calculated 15 metrics (no trades)")
+            return metrics
+
         metrics = {}
+        pct_summary = trade_pct_summary(profit_pcts)
 
         # Core metrics (5)
-        metrics["total_profit_pct"] = self._total_profit_pct(trades)
-        metrics["sharpe_ratio"] = self._sharpe_ratio(returns)
-        metrics["annual_return_pct"] = self._annual_return_pct(returns)
-        metrics["max_drawdown_pct"] = self._max_drawdown_pct(returns)
-        metrics["profit_factor"] = self._profit_factor(trades)
+        metrics["total_profit_pct"] = self._total_profit_pct(profits)
+        metrics["sharpe_ratio"] = self._sharpe_ratio(daily)
+        metrics["annual_return_pct"] = self._annual_return_pct(cagr)
+        metrics["max_drawdown_pct"] = self._max_drawdown_pct(max_dd)
+        metrics["profit_factor"] = self._profit_factor(pct_summary)
 
         # Trade statistics (4)
-        metrics["total_orders"] = len(trades)
-        metrics["win_rate_pct"] = self._win_rate_pct(trades)
-        metrics["pl_ratio"] = self._pl_ratio(trades)
-        metrics["winner_avg_pct"] = self._winner_avg_pct(trades)
-        metrics["loser_avg_pct"] = self._loser_avg_pct(trades)
+        metrics["total_orders"] = len(profits)
+        metrics["win_rate_pct"] = self._win_rate_pct(pct_summary)
+        metrics["pl_ratio"] = self._pl_ratio(pct_summary)
+        metrics["winner_avg_pct"] = self._winner_avg_pct(pct_summary)
+        metrics["loser_avg_pct"] = self._loser_avg_pct(pct_summary)
 
         # Bonus metrics (3)
-        metrics["sortino_ratio"] = self._sortino_ratio(returns)
-        metrics["calmar_ratio"] = self._calmar_ratio(returns)
-        metrics["recovery_factor"] = self._recovery_factor(trades, returns)
+        metrics["sortino_ratio"] = self._sortino_ratio(daily)
+        metrics["calmar_ratio"] = self._calmar_ratio(cagr, max_dd)
+        metrics["recovery_factor"] = self._recovery_factor(
+            profits, metrics["max_drawdown_pct"]
+        )
 
         self.logger.debug("Calculated 15 metrics")
         return metrics
@@ -73,115 +144,139 @@ class MetricsEngine:
         # Convert daily returns to cumulative returns
         cumulative = (1 + returns).cumprod() - 1
 
-        rolling_data = []
-        for i in range(len(returns)):
-            if i < window_days:
-                continue
+        # Change in cumulative return over each window, from the first full one
+        window_returns = (cumulative - cumulative.shift(window_days)).iloc[window_days:]
+        if window_returns.empty:
+            return pd.DataFrame()
 
-            window_start = i - window_days
-            window_return = cumulative.iloc[i] - cumulative.iloc[window_start]
+        return (
+            (window_returns * 100)
+            .rename("rolling_return_pct")
+            .rename_axis("date")
+            .to_frame()
+        )
 
-            rolling_data.append(
-                {
-                    "date": returns.index[i],
-                    "rolling_return_pct": window_return * 100,
-                }
-            )
+    @staticmethod
+    def _trade_values(trades: List[Dict], key: str) -> np.ndarray:
+        """Collect one numeric field from every trade.
 
-        if not rolling_data:
-            return pd.DataFrame()
+        Args:
+            trades: List of trade dicts
+            key: Field to collect; missing values count as 0
 
-        return pd.DataFrame(rolling_data).set_index("date")
+        Returns:
+            float64 array with one value per trade
+        """
+        return np.fromiter(
+            (t.get(key, 0) for t in trades), dtype=np.float64, count=len(trades)
+        )
 
     # ========== CORE METRICS (5) ==========
 
-    def _total_profit_pct(self, trades: List[Dict]) -> float:
+    def _total_profit_pct(self, profits: np.ndarray) -> float:
         """Calculate total profit as percentage of initial capital.
 
         Args:
-            trades: List of trade dicts with profit key
+            profits: Per-trade profit values
 
         Returns:
             Profit percentage
         """
-        if not trades:
+        if not profits.size:
             return 0.0
 
-        total_profit = sum(t.get("profit", 0) for t in trades)
-        return total_profit * 100
+        return float(profits.sum()) * 100
 
-    def _sharpe_ratio(self, returns: pd.Series) -> float:
-        """Calculate Sharpe ratio using empyrical.
+    @staticmethod
+    def _cagr(returns: np.ndarray) -> float:
+        """Compound annual growth rate of a daily return array.
 
         Args:
-            returns: Series of daily returns
+            returns: Daily returns; NaN days count as flat
+
+        Returns:
+            Annual growth rate as a fraction
+        """
+        num_years = returns.size / TRADING_DAYS
+        with np.errstate(invalid="ignore"):
+            return np.nanprod(returns + 1) ** (1 / num_years) - 1
+
+    @staticmethod
+    def _max_drawdown(returns: np.ndarray) -> float:
+        """Largest peak-to-trough fall of the compounded return path.
+
+        Args:
+            returns: Daily returns; NaN days count as flat
+
+        Returns:
+            Max drawdown as a negative fraction, or 0.0 without a decline
+        """
+        # The starting value is part of the path, so a loss on day one
+        # already counts as a drawdown
+        cumulative = np.empty(returns.size + 1)
+        cumulative[0] = 100
+        np.cumprod(np.where(np.isnan(returns), 0, returns) + 1, out=cumulative[1:])
+        cumulative[1:] *= 100
+        peaks = np.fmax.accumulate(cumulative)
+        return np.nanmin((cumulative - peaks) / peaks)
+
+    def _sharpe_ratio(self, returns: np.ndarray) -> float:
+        """Calculate Sharpe ratio.
+
+        Args:
+            returns: Daily returns
 
         Returns:
             Sharpe ratio (annualized)
         """
-        if len(returns) < 2:
+        if returns.size < 2:
             return 0.0
 
-        try:
-            return float(ep.sharpe_ratio(returns, period="daily"))
-        except (ValueError, ZeroDivisionError):
-            return 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.nanmean(returns) / np.nanstd(returns, ddof=1)
+        return float(sharpe * np.sqrt(TRADING_DAYS))
 
-    def _annual_return_pct(self, returns: pd.Series) -> float:
+    def _annual_return_pct(self, cagr: Optional[float]) -> float:
         """Calculate annualized return percentage.
 
         Args:
-            returns: Series of daily returns
+            cagr: Growth rate from _cagr(), or None for too few returns
 
         Returns:
             Annual return percentage
         """
-        if len(returns) < 2:
+        if cagr is None:
             return 0.0
 
-        try:
-            annual = ep.annual_return(returns, period="daily")
-            return float(annual * 100)
-        except (ValueError, ZeroDivisionError):
-            return 0.0
+        return float(cagr * 100)
 
-    def _max_drawdown_pct(self, returns: pd.Series) -> float:
+    def _max_drawdown_pct(self, max_dd: Optional[float]) -> float:
         """Calculate maximum drawdown percentage.
 
         Args:
-            returns: Series of daily returns
+            max_dd: Drawdown from _max_drawdown(), or None for too few returns
 
         Returns:
             Max drawdown as negative percentage (e.g., -15.5 for 15.5% loss)
         """
-        if len(returns) < 2:
+        if max_dd is None:
             return 0.0
 
-        try:
-            max_dd = ep.max_drawdown(returns)
-            return float(max_dd * 100)
-        except (ValueError, ZeroDivisionError):
-            return 0.0
+        return float(max_dd * 100)
 
-    def _profit_factor(self, trades: List[Dict]) -> float:
+    def _profit_factor(self, pct_summary: Tuple) -> float:
         """Calculate profit factor (Gross profit / Gross loss).
 
         Args:
-            trades: List of trade dicts with profit_pct key
+            pct_summary: Profit-percentage summary from trade_pct_summary()
 
         Returns:
             Profit factor (>1 is good)
         """
-        if not trades:
+        trade_count, _, _, gross_profit, gross_loss = pct_summary
+        if not trade_count:
             return 0.0
 
-        gross_profit = sum(
-            t.get("profit_pct", 0) for t in trades if t.get("profit_pct", 0) > 0
-        )
-        gross_loss = abs(
-            sum(t.get("profit_pct", 0) for t in trades if t.get("profit_pct", 0) < 0)
-        )
-
         if gross_loss == 0:
             return gross_profit if gross_profit > 0 else 0.0
 
@@ -189,137 +284,128 @@ class MetricsEngine:
 
     # ========== TRADE STATISTICS (4) ==========
 
-    def _win_rate_pct(self, trades: List[Dict]) -> float:
+    def _win_rate_pct(self, pct_summary: Tuple) -> float:
         """Calculate win rate percentage.
 
         Args:
-            trades: List of trade dicts
+            pct_summary: Profit-percentage summary from trade_pct_summary()
 
         Returns:
             Win rate as percentage (0-100)
         """
-        if not trades:
+        trade_count, win_count = pct_summary[:2]
+        if not trade_count:
             return 0.0
 
-        winning_trades = sum(1 for t in trades if t.get("profit_pct", 0) > 0)
-        return (winning_trades / len(trades)) * 100
+        return (win_count / trade_count) * 100
 
-    def _pl_ratio(self, trades: List[Dict]) -> float:
+    def _pl_ratio(self, pct_summary: Tuple) -> float:
         """Calculate profit/loss ratio (avg win / avg loss).
 
         Args:
-            trades: List of trade dicts
+            pct_summary: Profit-percentage summary from trade_pct_summary()
 
         Returns:
             P/L ratio (>1 is good)
         """
-        if not trades:
-            return 0.0
-
-        winning_trades = [t for t in trades if t.get("profit_pct", 0) > 0]
-        losing_trades = [t for t in trades if t.get("profit_pct", 0) < 0]
+        _, win_count, loss_count, gross_profit, gross_loss = pct_summary
 
-        if not winning_trades or not losing_trades:
+        if not win_count or not loss_count:
             return 0.0
 
-        avg_win = sum(t.get("profit_pct", 0) for t in winning_trades) / len(
-            winning_trades
-        )
-        avg_loss = abs(
-            sum(t.get("profit_pct", 0) for t in losing_trades) / len(losing_trades)
-        )
+        avg_win = gross_profit / win_count
+        avg_loss = gross_loss / loss_count
 
         if avg_loss == 0:
             return avg_win if avg_win > 0 else 0.0
 
         return avg_win / avg_loss
 
-    def _winner_avg_pct(self, trades: List[Dict]) -> float:
+    def _winner_avg_pct(self, pct_summary: Tuple) -> float:
         """Calculate average win percentage.
 
         Args:
-            trades: List of trade dicts
+            pct_summary: Profit-percentage summary from trade_pct_summary()
 
         Returns:
             Average winning trade percentage
         """
-        if not trades:
-            return 0.0
+        _, win_count, _, gross_profit, _ = pct_summary
 
-        winning_trades = [t for t in trades if t.get("profit_pct", 0) > 0]
-
-        if not winning_trades:
+        if not win_count:
             return 0.0
 
-        return sum(t.get("profit_pct", 0) for t in winning_trades) / len(winning_trades)
+        return gross_profit / win_count
 
-    def _loser_avg_pct(self, trades: List[Dict]) -> float:
+    def _loser_avg_pct(self, pct_summary: Tuple) -> float:
         """Calculate average loss percentage.
 
         Args:
-            trades: List of trade dicts
+            pct_summary: Profit-percentage summary from trade_pct_summary()
 
         Returns:
             Average losing trade percentage (as negative)
         """
-        if not trades:
-            return 0.0
-
-        losing_trades = [t for t in trades if t.get("profit_pct", 0) < 0]
+        _, _, loss_count, _, gross_loss = pct_summary
 
-        if not losing_trades:
+        if not loss_count:
             return 0.0
 
-        return sum(t.get("profit_pct", 0) for t in losing_trades) / len(losing_trades)
+        return -gross_loss / loss_count
 
     # ========== BONUS METRICS (3) ==========
 
-    def _sortino_ratio(self, returns: pd.Series) -> float:
+    def _sortino_ratio(self, returns: np.ndarray) -> float:
         """Calculate Sortino ratio (return vs downside volatility).
 
         Args:
-            returns: Series of daily returns
+            returns: Daily returns
 
         Returns:
             Sortino ratio (annualized)
         """
-        if len(returns) < 2:
+        if returns.size < 2:
             return 0.0
 
-        try:
-            return float(ep.sortino_ratio(returns, period="daily"))
-        except (ValueError, ZeroDivisionError):
-            return 0.0
+        # Downside deviation: root mean square of the negative part of
+        # every return, not the standard deviation of the losing days
+        downside = np.sqrt(np.nanmean(np.square(np.minimum(returns, 0))))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sortino = (np.nanmean(returns) * TRADING_DAYS) / (
+                downside * np.sqrt(TRADING_DAYS)
+            )
+        return float(sortino)
 
-    def _calmar_ratio(self, returns: pd.Series) -> float:
+    def _calmar_ratio(self, cagr: Optional[float], max_dd: Optional[float]) -> float:
         """Calculate Calmar ratio (annual return / max drawdown).
 
         Args:
-            returns: Series of daily returns
+            cagr: Growth rate from _cagr(), or None for too few returns
+            max_dd: Drawdown from _max_drawdown(), or None for too few returns
 
         Returns:
-            Calmar ratio
+            Calmar ratio, NaN when there is no drawdown
         """
-        if len(returns) < 2:
+        if cagr is None or max_dd is None:
             return 0.0
 
-        try:
-            return float(ep.calmar_ratio(returns, period="daily"))
-        except (ValueError, ZeroDivisionError):
-            return 0.0
+        if not max_dd < 0:
+            return np.nan
+
+        calmar = cagr / abs(max_dd)
+        return np.nan if np.isinf(calmar) else float(calmar)
 
-    def _recovery_factor(self, trades: List[Dict], returns: pd.Series) -> float:
+    def _recovery_factor(self, profits: np.ndarray, max_dd: float) -> float:
         """Calculate recovery factor (net profit / max drawdown).
 
         Args:
-            trades: List of trade dicts
-            returns: Series of daily returns
+            profits: Per-trade profit values
+            max_dd: Max drawdown percentage from _max_drawdown_pct()
 
         Returns:
             Recovery factor
         """
-        net_profit = sum(t.get("profit", 0) for t in trades)
-        max_dd = self._max_drawdown_pct(returns)
+        net_profit = float(profits.sum())
 
         if max_dd == 0 or net_profit == 0:
             return 0.0
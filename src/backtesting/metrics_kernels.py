@@ -0,0 +1,32 @@
+# fx_trading_bot/src/backtesting/metrics_kernels.py
+# Purpose: Numba-compiled reductions behind the MetricsEngine trade statistics
+from numba import njit
+
+
+@njit(cache=True)
+def trade_pct_summary(pcts):
+    """Summarize per-trade profit percentages in a single pass.
+
+    Zero and NaN values count towards the trade total but are neither
+    winners nor losers, matching the ``> 0`` / ``< 0`` filters used by the
+    metric helpers.
+
+    Args:
+        pcts: Per-trade profit percentages as a float64 array
+
+    Returns:
+        Tuple of (trade_count, win_count, loss_count, gross_profit,
+        gross_loss), where gross_loss is the absolute sum of losing trades
+    """
+    win_count = 0
+    loss_count = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    for pct in pcts:
+        if pct > 0:
+            win_count += 1
+            gross_profit += pct
+        elif pct < 0:
+            loss_count += 1
+            gross_loss -= pct
+    return pcts.shape[0], win_count, loss_count, gross_profit, gross_loss
@@ -90,11 +90,24 @@ class TradeExtractor:
                     "Duration": "duration_hours",
                 }
                 df_renamed = trades_list.copy()
+                # backtesting.py 0.6 reports PnL and ReturnPct (a fraction)
+                # instead of PL and PLPct
+                if "PL" not in df_renamed.columns and "PnL" in df_renamed.columns:
+                    df_renamed["PL"] = df_renamed["PnL"]
+                if "PLPct" not in df_renamed.columns and "ReturnPct" in df_renamed.columns:
+                    df_renamed["PLPct"] = df_renamed["ReturnPct"] * 100
                 # Rename only columns that exist
                 cols_to_rename = {
                     k: v for k, v in col_mapping.items() if k in df_renamed.columns
                 }
                 df_renamed = df_renamed.rename(columns=cols_to_rename)
+                # Duration is a Timedelta; store it in hours as the column name says
+                if "duration_hours" in df_renamed.columns and pd.api.types.is_timedelta64_dtype(
+                    df_renamed["duration_hours"]
+                ):
+                    df_renamed["duration_hours"] = (
+                        df_renamed["duration_hours"].dt.total_seconds() / 3600
+                    )
                 # Select only our standard columns
                 standard_cols = [
                     "entry_time",
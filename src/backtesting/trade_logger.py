@@ -3,18 +3,41 @@
 from datetime import datetime
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
 from src.utils.logging_factory import LoggingFactory
 
+# Per-trade fields, in the column order of get_trades_df()
+TRADE_FIELDS = (
+    "entry_time",
+    "exit_time",
+    "symbol",
+    "entry_price",
+    "exit_price",
+    "volume",
+    "profit",
+    "profit_pct",
+    "duration_hours",
+)
+
 
 class TradeLogger:
-    """Log and track detailed trade information during backtest."""
+    """Log and track detailed trade information during backtest.
+
+    Trades are stored column-wise (one list per field) so metrics can read a
+    whole field as an array; per-trade dicts are built only when requested.
+    """
 
     def __init__(self):
         """Initialize trade logger."""
         self.logger = LoggingFactory.get_logger(__name__)
-        self.trades: List[Dict] = []
+        self._columns: Dict[str, List] = {field: [] for field in TRADE_FIELDS}
+
+    @property
+    def trades(self) -> List[Dict]:
+        """List of logged trades, one dict per trade."""
+        return [dict(zip(TRADE_FIELDS, row)) for row in zip(*self._columns.values())]
 
     def log_trade(
         self,
@@ -39,19 +62,19 @@ class TradeLogger:
         """
         profit_pct = ((exit_price - entry_price) / entry_price) * 100
 
-        trade = {
-            "entry_time": entry_time,
-            "exit_time": exit_time,
-            "symbol": symbol,
-            "entry_price": entry_price,
-            "exit_price": exit_price,
-            "volume": volume,
-            "profit": profit,
-            "profit_pct": profit_pct,
-            "duration_hours": (exit_time - entry_time).total_seconds() / 3600,
-        }
-
-        self.trades.append(trade)
+        values = (
+            entry_time,
+            exit_time,
+            symbol,
+            entry_price,
+            exit_price,
+            volume,
+            profit,
+            profit_pct,
+            (exit_time - entry_time).total_seconds() / 3600,
+        )
+        for field, value in zip(TRADE_FIELDS, values):
+            self._columns[field].append(value)
         self.logger.debug(
             "Logged trade: %s, profit: %.2f (%.2f%%)", symbol, profit, profit_pct
         )
@@ -70,10 +93,21 @@ class TradeLogger:
         Returns:
             DataFrame with all trades
         """
-        if not self.trades:
+        if not self.get_trade_count():
             return pd.DataFrame()
 
-        return pd.DataFrame(self.trades)
+        return pd.DataFrame(self._columns)
+
+    def get_column(self, field: str) -> np.ndarray:
+        """Get one numeric trade field for every logged trade.
+
+        Args:
+            field: Numeric field name, e.g. 'profit' or 'profit_pct'
+
+        Returns:
+            float64 array with one value per trade
+        """
+        return np.asarray(self._columns[field], dtype=np.float64)
 
     def get_trade_count(self) -> int:
         """Get total number of trades logged.
@@ -81,7 +115,7 @@ class TradeLogger:
         Returns:
             Integer trade count
         """
-        return len(self.trades)
+        return len(self._columns["profit"])
 
     def get_winning_trades(self) -> List[Dict]:
         """Get all winning trades.
@@ -105,7 +139,8 @@ class TradeLogger:
         Returns:
             None.
         """
-        self.trades = []
+        for values in self._columns.values():
+            values.clear()
         self.logger.debug("Cleared all trades")
 
     def export_to_csv(self, filepath: str) -> bool:
@@ -136,7 +171,8 @@ class TradeLogger:
         Returns:
             Dictionary with summary statistics
         """
-        if not self.trades:
+        trade_count = self.get_trade_count()
+        if not trade_count:
             return {
                 "total_trades": 0,
                 "winning_trades": 0,
@@ -147,20 +183,19 @@ class TradeLogger:
                 "avg_loss": 0.0,
             }
 
-        winning = self.get_winning_trades()
-        losing = self.get_losing_trades()
+        profits = self.get_column("profit")
+        winning = profits[profits > 0]
+        losing = profits[profits < 0]
 
-        total_profit = sum(t["profit"] for t in self.trades)
-        avg_profit = (
-            sum(t["profit"] for t in winning) / len(winning) if winning else 0.0
-        )
-        avg_loss = sum(t["profit"] for t in losing) / len(losing) if losing else 0.0
+        total_profit = float(profits.sum())
+        avg_profit = float(winning.mean()) if winning.size else 0.0
+        avg_loss = float(losing.mean()) if losing.size else 0.0
 
         return {
-            "total_trades": len(self.trades),
-            "winning_trades": len(winning),
-            "losing_trades": len(losing),
-            "win_rate": (len(winning) / len(self.trades)) * 100,
+            "total_trades": trade_count,
+            "winning_trades": int(winning.size),
+            "losing_trades": int(losing.size),
+            "win_rate": (winning.size / trade_count) * 100,
             "total_profit": total_profit,
             "avg_profit": avg_profit,
             "avg_loss": avg_loss,
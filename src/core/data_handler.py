@@ -20,27 +20,39 @@ class DataHandler:
         self.config = config
         self.logger = LoggingFactory.get_logger(__name__)
 
-    def prepare_backtest_data(self, symbol, timeframe):
+    def prepare_backtest_data(self, symbol, timeframe, start_date=None, end_date=None):
         """Prepare data for backtesting from database.
-        Uses all available data in market_data table (no date filtering).
+        Uses all available data in market_data table unless a date range is given;
+        the range is applied in SQL so only the requested window is loaded.
 
         Args:
             symbol: Currency pair symbol (e.g., 'EURUSD')
             timeframe: Timeframe string (e.g., 'H1', 'M15')
+            start_date: Optional inclusive start date (YYYY-MM-DD or datetime)
+            end_date: Optional inclusive end date (YYYY-MM-DD or datetime)
 
         Returns:
             DataFrame with OHLC data indexed by datetime, or None if no data available
         """
         try:
-            # Fetch all available data from market_data table
             # Uses new schema: direct symbol column, tick_volume (not volume), composite key
             query = """
                 SELECT open, high, low, close, tick_volume AS volume, time
                 FROM market_data
                 WHERE symbol = ? AND timeframe = ?
-                ORDER BY time ASC
             """
-            data = pd.read_sql(query, self.db.conn, params=(symbol, timeframe))
+            params = [symbol, timeframe]
+            # time is stored as 'YYYY-MM-DD HH:MM:SS' text, so bounds compare lexically
+            if start_date is not None:
+                query += " AND time >= ?"
+                params.append(pd.to_datetime(start_date).strftime("%Y-%m-%d %H:%M:%S"))
+            if end_date is not None:
+                query += " AND time <= ?"
+                params.append(pd.to_datetime(end_date).strftime("%Y-%m-%d %H:%M:%S"))
+            query += " ORDER BY time ASC"
+            data = pd.read_sql(
+                query, self.db.conn, params=tuple(params), parse_dates=["time"]
+            )
 
             if data.empty:
                 self.logger.warning(
@@ -64,7 +76,6 @@ class DataHandler:
                     "volume": "Volume",
                 }
             )
-            data["Datetime"] = pd.to_datetime(data["Datetime"])
             data.set_index("Datetime", inplace=True)
             self.logger.info(
                 "Prepared %s rows for backtesting: %s (%s) [Range: %s to %s]",
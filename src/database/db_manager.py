@@ -2,10 +2,15 @@
 # Purpose: Manages database connections and operations
 import os
 import sqlite3
+from contextlib import contextmanager
 
 from src.database.migrations import DatabaseMigrations
 from src.utils.logging_factory import LoggingFactory
 
+# Seconds a connection waits for another connection's write lock (e.g. the
+# dashboard or a backtest worker) before raising "database is locked"
+BUSY_TIMEOUT_SECONDS = 30.0
+
 
 class DatabaseManager:
     """Manages database connections and operations.
@@ -48,6 +53,8 @@ class DatabaseManager:
             self.config = {}
 
         self.conn = None
+        self._in_transaction = False
+        self._savepoint_depth = 0
         self.logger = LoggingFactory.get_logger(__name__)
 
     def __enter__(self):
@@ -76,9 +83,13 @@ class DatabaseManager:
                 if dir_path:  # Only create if there's a directory component
                     os.makedirs(dir_path, exist_ok=True)
 
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
             # Enable foreign keys and dictionary row access
             self.conn.execute("PRAGMA foreign_keys = ON")
+            # WAL + NORMAL sync: commits no longer fsync the main database file
+            if self.db_path != ":memory:":
+                self.conn.execute("PRAGMA journal_mode = WAL")
+                self.conn.execute("PRAGMA synchronous = NORMAL")
             self.conn.row_factory = sqlite3.Row
             self.logger.debug("Database connection established: %s", self.db_path)
         except sqlite3.Error as e:
@@ -107,12 +118,89 @@ class DatabaseManager:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-            self.conn.commit()
+            if not self._in_transaction:
+                self.conn.commit()
             return cursor
         except sqlite3.Error as e:
             self.logger.error("Query execution failed: %s, Error: %s", query, e)
             raise
 
+    def execute_many(self, query, params_seq):
+        """Execute a parameterized SQL statement once per parameter row.
+
+        All rows go through a single executemany() call and one commit
+        (deferred to the enclosing transaction() block, if any).
+
+        Args:
+            query: SQL query string
+            params_seq: Iterable of parameter tuples
+
+        Returns:
+            Cursor object of the executed statement
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany(query, params_seq)
+            if not self._in_transaction:
+                self.conn.commit()
+            return cursor
+        except sqlite3.Error as e:
+            self.logger.error("Batch execution failed: %s, Error: %s", query, e)
+            raise
+
+    @contextmanager
+    def transaction(self):
+        """Group execute_query() calls into a single commit.
+
+        Queries issued inside the block skip their per-call commit; the block
+        commits once on success and rolls back if an exception escapes.
+        Nested blocks run inside the outermost transaction under their own
+        savepoint, so an exception leaving a nested block undoes its writes
+        even when the caller handles it and the outer block commits.
+
+        Yields:
+            This DatabaseManager instance
+        """
+        if self._in_transaction:
+            with self._savepoint():
+                yield self
+            return
+        self._in_transaction = True
+        try:
+            yield self
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+
+    @contextmanager
+    def _savepoint(self):
+        """Run a nested transaction() block under a SAVEPOINT.
+
+        Yields:
+            None
+        """
+        if not self.conn.in_transaction:
+            # SAVEPOINT outside a transaction would commit on RELEASE
+            self.conn.execute("BEGIN")
+        self._savepoint_depth += 1
+        name = f"nested_{self._savepoint_depth}"
+        self.conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except Exception:
+            # Some errors abort the whole transaction, taking the savepoint along
+            if self.conn.in_transaction:
+                self.conn.execute(f"ROLLBACK TO {name}")
+                self.conn.execute(f"RELEASE {name}")
+            raise
+        else:
+            self.conn.execute(f"RELEASE {name}")
+        finally:
+            self._savepoint_depth -= 1
+
     def create_tables(self):
         """Create necessary database tables and run migrations."""
         migrations = DatabaseMigrations(self.conn)
@@ -211,12 +211,18 @@ class DatabaseMigrations:
 
             indexes = [
                 # Market data indexes (unified table without foreign key)
-                "CREATE INDEX IF NOT EXISTS idx_market_data_symbol_timeframe ON market_data(symbol, timeframe)",
                 "CREATE INDEX IF NOT EXISTS idx_market_data_time ON market_data(time DESC)",
+                # Ordered per-pair scans (backtest data windows); its
+                # (symbol, timeframe) prefix also serves plain pair lookups
+                "CREATE INDEX IF NOT EXISTS idx_market_data_symbol_tf_time ON market_data(symbol, timeframe, time)",
+                "DROP INDEX IF EXISTS idx_market_data_symbol_timeframe",
                 # Backtest backtests indexes (for new schema)
-                "CREATE INDEX IF NOT EXISTS idx_backtest_backtests_strategy_symbol ON backtest_backtests(strategy_id, symbol_id)",
                 "CREATE INDEX IF NOT EXISTS idx_backtest_backtests_symbol_timeframe ON backtest_backtests(symbol_id, timeframe)",
                 "CREATE INDEX IF NOT EXISTS idx_backtest_backtests_timestamp ON backtest_backtests(timestamp DESC)",
+                # Latest-result-per-strategy/symbol lookups (multi-backtest report);
+                # its (strategy_id, symbol_id) prefix also serves plain pair lookups
+                "CREATE INDEX IF NOT EXISTS idx_backtest_backtests_strategy_symbol_ts ON backtest_backtests(strategy_id, symbol_id, timestamp DESC)",
+                "DROP INDEX IF EXISTS idx_backtest_backtests_strategy_symbol",
                 # Legacy backtest result indexes (if backtest_results still exists)
                 "CREATE INDEX IF NOT EXISTS idx_backtest_results_symbol_timeframe ON backtest_results(symbol, timeframe, rank_score DESC)",
                 "CREATE INDEX IF NOT EXISTS idx_backtest_results_strategy_rank ON backtest_results(strategy_name, rank_score DESC)",
@@ -245,6 +251,10 @@ class DatabaseMigrations:
             for index_sql in indexes:
                 cursor.execute(index_sql)
 
+            # Refresh planner statistics so new indexes get used; a no-op when
+            # the statistics are already current
+            cursor.execute("PRAGMA optimize")
+
             self.conn.commit()
             self.logger.info("All database indexes created successfully")
             return True
@@ -1,2 +1,2 @@
 # fx_trading_bot/src/strategies/__init__.py
-# Purpose: Package marker for strategies directory
\ No newline at end of file
+# Purpose: Package marker for strategies directory
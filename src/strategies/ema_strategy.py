@@ -1,11 +1,18 @@
 # fx_trading_bot/src/strategies/ema_strategy.py
 # Purpose: Implements EMA Crossover trading strategy
 # pylint: disable=no-member
-import pandas as pd
+import numpy as np
 import ta
 
 from backtesting import Strategy
 from src.core.base_strategy import BaseStrategy
+from src.strategies.signal_kernels import (
+    BUY,
+    HOLD,
+    SELL,
+    cached_ema_no_warmup,
+    cross_actions,
+)
 
 
 class EMAStrategy(BaseStrategy):
@@ -165,36 +172,32 @@ class EMAStrategy(BaseStrategy):
 
         def init(self):
             """Initialize EMA indicators for backtesting framework."""
+            # EMAs are computed on the raw close array by the compiled kernel,
+            # so no pandas Series is built per indicator
             self.ema_fast = self.I(
-                lambda x: pd.Series(x).ewm(span=self.fast_period, adjust=False).mean(),
-                self.data.Close,
+                cached_ema_no_warmup, self.data.Close, self.fast_period, name="EMA({1})"
             )
             self.ema_slow = self.I(
-                lambda x: pd.Series(x).ewm(span=self.slow_period, adjust=False).mean(),
-                self.data.Close,
+                cached_ema_no_warmup, self.data.Close, self.slow_period, name="EMA({1})"
             )
+            # Crossovers are resolved once for all bars; the first slow_period
+            # bars are held flat until the slow EMA has enough history
+            actions = cross_actions(
+                np.asarray(self.ema_fast, dtype=np.float64),
+                np.asarray(self.ema_slow, dtype=np.float64),
+            )
+            actions[: self.slow_period] = HOLD
+            self.actions = self.I(np.asarray, actions, name="EMA cross", plot=False)
 
         def next(self):
             """Execute EMA crossover strategy logic on each price bar."""
-            if len(self.data) < self.slow_period + 1:
-                return
-
-            # Skip if not enough data
-            if pd.isna(self.ema_fast[-1]) or pd.isna(self.ema_slow[-1]):
+            action = self.actions[-1]
+            if action == HOLD:
                 return
 
-            # Golden Cross: Buy signal
-            if (
-                self.ema_fast[-2] <= self.ema_slow[-2]
-                and self.ema_fast[-1] > self.ema_slow[-1]
-            ):
+            if action == BUY:  # Golden Cross
                 if not self.position:
                     self.buy()
-
-            # Death Cross: Sell signal
-            if (
-                self.ema_fast[-2] >= self.ema_slow[-2]
-                and self.ema_fast[-1] < self.ema_slow[-1]
-            ):
+            elif action == SELL:  # Death Cross
                 if self.position:
                     self.position.close()
@@ -1,11 +1,17 @@
 # fx_trading_bot/src/strategies/macd_strategy.py
 # Purpose: Implements MACD-based trading strategy
 
-import pandas as pd
+import numpy as np
 import ta
 
 from backtesting import Strategy
 from src.core.base_strategy import BaseStrategy
+from src.strategies.signal_kernels import (
+    BUY,
+    SELL,
+    cached_macd_lines,
+    cross_actions,
+)
 
 
 class MACDStrategy(BaseStrategy):
@@ -230,21 +236,27 @@ class MACDStrategy(BaseStrategy):
         volume = 0.01
         macd = None  # type: ignore
         signal = None  # type: ignore
+        actions = None  # type: ignore
 
         def init(self):
-            """Initialize MACD indicator for backtesting framework."""
-            macd = ta.trend.MACD(
-                pd.Series(self.data.Close),
-                window_fast=self.fast_period,
-                window_slow=self.slow_period,
-                window_sign=self.signal_period,
+            """Initialize MACD indicator and precomputed crossover actions."""
+            macd_line, signal_line = cached_macd_lines(
+                self.data.Close,
+                self.fast_period,
+                self.slow_period,
+                self.signal_period,
             )
-            self.macd = self.I(macd.macd)
-            self.signal = self.I(macd.macd_signal)
+            self.macd = self.I(np.asarray, macd_line, name="MACD")
+            self.signal = self.I(np.asarray, signal_line, name="MACD signal")
+            # Crossovers are resolved for every bar in one compiled pass so
+            # next() only has to read the action for the current bar
+            actions = cross_actions(macd_line, signal_line)
+            self.actions = self.I(np.asarray, actions, name="MACD actions", plot=False)
 
         def next(self):
             """Execute MACD crossover strategy logic on each price bar."""
-            if self.macd[-1] > self.signal[-1] and self.macd[-2] <= self.signal[-2]:
+            action = self.actions[-1]
+            if action == BUY:
                 self.buy(size=self.volume)
-            elif self.macd[-1] < self.signal[-1] and self.macd[-2] >= self.signal[-2]:
+            elif action == SELL:
                 self.sell(size=self.volume)
@@ -1,11 +1,12 @@
 # fx_trading_bot/src/strategies/rsi_strategy.py
 # Purpose: Implements RSI-based trading strategy
 # pylint: disable=no-member
-import pandas as pd
+import numpy as np
 import ta
 
 from backtesting import Strategy
 from src.core.base_strategy import BaseStrategy
+from src.strategies.signal_kernels import BUY, SELL, cached_rsi, rsi_threshold_actions
 
 
 class RSIStrategy(BaseStrategy):
@@ -169,19 +170,25 @@ class RSIStrategy(BaseStrategy):
         oversold = 30
         volume = 0.01
         rsi = None  # type: ignore
+        actions = None  # type: ignore
 
         def init(self):
-            """Initialize RSI indicator for backtesting framework."""
-            self.rsi = self.I(
-                lambda x: ta.momentum.RSIIndicator(
-                    pd.Series(x), window=self.period
-                ).rsi(),
-                self.data.Close,
+            """Initialize RSI indicator and precomputed threshold actions."""
+            rsi_line = cached_rsi(self.data.Close, self.period)
+            self.rsi = self.I(np.asarray, rsi_line, name="RSI")
+            # Threshold crosses are resolved for every bar in one compiled
+            # pass so next() only has to read the action for the current bar
+            actions = rsi_threshold_actions(
+                rsi_line,
+                float(self.oversold),
+                float(self.overbought),
             )
+            self.actions = self.I(np.asarray, actions, name="RSI actions", plot=False)
 
         def next(self):
             """Execute RSI overbought/oversold strategy logic on each price bar."""
-            if self.rsi[-1] < self.oversold and self.rsi[-2] >= self.oversold:
+            action = self.actions[-1]
+            if action == BUY:
                 self.buy(size=self.volume)
-            elif self.rsi[-1] > self.overbought and self.rsi[-2] <= self.overbought:
+            elif action == SELL:
                 self.sell(size=self.volume)
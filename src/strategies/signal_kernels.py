@@ -0,0 +1,305 @@
+# fx_trading_bot/src/strategies/signal_kernels.py
+# Purpose: Numba-compiled signal kernels shared by the backtesting.py strategies
+import hashlib
+
+import numpy as np
+from numba import njit
+
+# Action codes emitted by the kernels and consumed by Strategy.next()
+HOLD = 0
+BUY = 1
+SELL = -1
+
+
+@njit(cache=True)
+def _ewm_mean(values, alpha, min_periods):
+    """Exponentially weighted mean matching ``Series.ewm(adjust=False)``.
+
+    Reproduces the pandas recursion step for step (including leading NaN
+    handling) so results are identical to the ``ta`` implementations.
+
+    Args:
+        values: Input float64 array
+        alpha: Smoothing factor in (0, 1]
+        min_periods: Observations required before a value is emitted
+
+    Returns:
+        float64 array with NaN where fewer than ``min_periods`` observations
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    nobs = 0 if np.isnan(weighted) else 1
+    if nobs >= min_periods:
+        out[0] = weighted
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = values[i]
+        is_obs = not np.isnan(cur)
+        if is_obs:
+            nobs += 1
+        if not np.isnan(weighted):
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_obs:
+            weighted = cur
+        if nobs >= min_periods:
+            out[i] = weighted
+    return out
+
+
+@njit(cache=True)
+def ema(values, span):
+    """Compute an EMA equivalent to ``ta.utils._ema`` (``fillna=False``).
+
+    Args:
+        values: Input float64 array
+        span: EMA span in bars
+
+    Returns:
+        float64 array of EMA values with NaN warm-up
+    """
+    return _ewm_mean(values, 2.0 / (span + 1.0), span)
+
+
+@njit(cache=True)
+def ema_no_warmup(values, span):
+    """Compute an EMA seeded from the first value.
+
+    Equivalent to ``Series.ewm(span=span, adjust=False).mean()``, which
+    emits a value from the first bar instead of padding with NaN.
+
+    Args:
+        values: Input float64 array
+        span: EMA span in bars
+
+    Returns:
+        float64 array of EMA values
+    """
+    return _ewm_mean(values, 2.0 / (span + 1.0), 1)
+
+
+@njit(cache=True)
+def macd_lines(close, fast_period, slow_period, signal_period):
+    """Compute MACD and signal lines equivalent to ``ta.trend.MACD``.
+
+    Args:
+        close: Close prices as a float64 array
+        fast_period: Fast EMA span
+        slow_period: Slow EMA span
+        signal_period: Signal EMA span
+
+    Returns:
+        Tuple of (macd, signal) float64 arrays
+    """
+    macd = ema(close, fast_period) - ema(close, slow_period)
+    return macd, ema(macd, signal_period)
+
+
+@njit(cache=True)
+def rsi(close, period):
+    """Compute Wilder RSI equivalent to ``ta.momentum.RSIIndicator``.
+
+    Args:
+        close: Close prices as a float64 array
+        period: RSI lookback period
+
+    Returns:
+        float64 array of RSI values with NaN warm-up
+    """
+    n = close.shape[0]
+    up = np.zeros(n)
+    down = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            up[i] = delta
+        elif delta < 0:
+            down[i] = -delta
+
+    alpha = 1.0 / period
+    ema_up = _ewm_mean(up, alpha, period)
+    ema_down = _ewm_mean(down, alpha, period)
+    out = np.full(n, np.nan)
+    for i in range(n):
+        if ema_down[i] == 0:
+            out[i] = 100.0
+        elif not np.isnan(ema_down[i]):
+            out[i] = 100.0 - 100.0 / (1.0 + ema_up[i] / ema_down[i])
+    return out
+
+
+@njit(cache=True)
+def cross_actions(line, reference):
+    """Compute per-bar crossover actions between two lines.
+
+    A buy fires on the bar where ``line`` crosses above ``reference`` (from
+    at-or-below), a sell where it crosses below (from at-or-above). Used for
+    MACD/signal as well as fast/slow moving-average crossovers. NaN warm-up
+    values compare False and therefore yield HOLD.
+
+    Args:
+        line: Crossing line as a float64 array
+        reference: Reference line as a float64 array of the same length
+
+    Returns:
+        int8 array of BUY/SELL/HOLD codes, one per bar
+    """
+    n = line.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    for i in range(1, n):
+        if line[i] > reference[i] and line[i - 1] <= reference[i - 1]:
+            actions[i] = BUY
+        elif line[i] < reference[i] and line[i - 1] >= reference[i - 1]:
+            actions[i] = SELL
+    return actions
+
+
+@njit(cache=True)
+def rsi_threshold_actions(rsi, oversold, overbought):
+    """Compute per-bar RSI oversold/overbought threshold-cross actions.
+
+    A buy fires when RSI drops below ``oversold``, a sell when it rises
+    above ``overbought``. NaN warm-up values compare False and yield HOLD.
+
+    Args:
+        rsi: RSI values as a float64 array
+        oversold: Oversold threshold
+        overbought: Overbought threshold
+
+    Returns:
+        int8 array of BUY/SELL/HOLD codes, one per bar
+    """
+    n = rsi.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    for i in range(1, n):
+        if rsi[i] < oversold and rsi[i - 1] >= oversold:
+            actions[i] = BUY
+        elif rsi[i] > overbought and rsi[i - 1] <= overbought:
+            actions[i] = SELL
+    return actions
+
+
+# ========== MEMOIZED INDICATORS ==========
+# Parameter sweeps run init() once per combination on the same close array;
+# EMAs and RSI lines only depend on (close, period), so they are computed once
+# per sweep and shared. Entries are keyed on a digest of the close prices so
+# the cache never holds copies of the series, and cached arrays are read-only
+# to keep sharing safe.
+
+_CACHE_SIZE = 64
+_indicator_cache = {}
+
+
+def _as_array(close):
+    """Return the close prices as a contiguous float64 array."""
+    return np.ascontiguousarray(close, dtype=np.float64)
+
+
+def _as_key(values):
+    """Return a fixed-size cache key identifying a float64 close array."""
+    return values.shape[0], hashlib.blake2b(values, digest_size=16).digest()
+
+
+def _read_only(line):
+    """Mark an indicator array read-only and return it."""
+    line.flags.writeable = False
+    return line
+
+
+def _memoize(key, compute):
+    """Return the cached value for ``key``, computing it on a miss.
+
+    The cache is bounded to ``_CACHE_SIZE`` entries; the oldest entry is
+    evicted first since sweeps move through indicator periods in order.
+    """
+    value = _indicator_cache.get(key)
+    if value is None:
+        if len(_indicator_cache) >= _CACHE_SIZE:
+            del _indicator_cache[next(iter(_indicator_cache))]
+        value = _indicator_cache[key] = compute()
+    return value
+
+
+def _cached_ema(values, close_key, span):
+    """Memoized EMA over ``values``, identified by ``close_key``."""
+    return _memoize(("ema", close_key, span), lambda: _read_only(ema(values, span)))
+
+
+def cached_ema_no_warmup(close, span):
+    """Return a seeded EMA, reusing results across identical inputs.
+
+    Args:
+        close: Close prices
+        span: EMA span in bars
+
+    Returns:
+        Read-only float64 array of EMA values
+    """
+    values = _as_array(close)
+    span = int(span)
+    return _memoize(
+        ("ema_no_warmup", _as_key(values), span),
+        lambda: _read_only(ema_no_warmup(values, span)),
+    )
+
+
+def cached_macd_lines(close, fast_period, slow_period, signal_period):
+    """Return MACD and signal lines, reusing results across identical inputs.
+
+    Args:
+        close: Close prices
+        fast_period: Fast EMA span
+        slow_period: Slow EMA span
+        signal_period: Signal EMA span
+
+    Returns:
+        Tuple of read-only (macd, signal) float64 arrays
+    """
+    values = _as_array(close)
+    close_key = _as_key(values)
+    fast_period, slow_period, signal_period = (
+        int(fast_period),
+        int(slow_period),
+        int(signal_period),
+    )
+
+    def compute():
+        # Built from the cached fast and slow EMAs, which sweeps share
+        macd = _cached_ema(values, close_key, fast_period) - _cached_ema(
+            values, close_key, slow_period
+        )
+        return _read_only(macd), _read_only(ema(macd, signal_period))
+
+    return _memoize(
+        ("macd", close_key, fast_period, slow_period, signal_period), compute
+    )
+
+
+def cached_rsi(close, period):
+    """Return RSI values, reusing results across identical inputs.
+
+    Args:
+        close: Close prices
+        period: RSI lookback period
+
+    Returns:
+        Read-only float64 array of RSI values
+    """
+    values = _as_array(close)
+    period = int(period)
+    return _memoize(
+        ("rsi", _as_key(values), period), lambda: _read_only(rsi(values, period))
+    )
+
+
+def clear_indicator_cache():
+    """Drop all memoized indicator arrays."""
+    _indicator_cache.clear()
@@ -1,11 +1,13 @@
 # fx_trading_bot/src/strategies/sma_strategy.py
 # Purpose: Implements SMA Crossover trading strategy
 # pylint: disable=no-member
+import numpy as np
 import pandas as pd
 import ta
 
 from backtesting import Strategy
 from src.core.base_strategy import BaseStrategy
+from src.strategies.signal_kernels import BUY, HOLD, SELL, cross_actions
 
 
 class SMAStrategy(BaseStrategy):
@@ -171,28 +173,24 @@ class SMAStrategy(BaseStrategy):
                 lambda x: pd.Series(x).rolling(self.slow_period).mean(),
                 self.data.Close,
             )
+            # Crossovers are resolved once for all bars; the first slow_period
+            # bars are held flat until the slow SMA has enough history
+            actions = cross_actions(
+                np.asarray(self.sma_fast, dtype=np.float64),
+                np.asarray(self.sma_slow, dtype=np.float64),
+            )
+            actions[: self.slow_period] = HOLD
+            self.actions = self.I(np.asarray, actions, name="SMA cross", plot=False)
 
         def next(self):
             """Execute SMA crossover strategy logic on each price bar."""
-            if len(self.data) < self.slow_period + 1:
-                return
-
-            # Skip if not enough data
-            if pd.isna(self.sma_fast[-1]) or pd.isna(self.sma_slow[-1]):
+            action = self.actions[-1]
+            if action == HOLD:
                 return
 
-            # Golden Cross: Buy signal
-            if (
-                self.sma_fast[-2] <= self.sma_slow[-2]
-                and self.sma_fast[-1] > self.sma_slow[-1]
-            ):
+            if action == BUY:  # Golden Cross
                 if not self.position:
                     self.buy()
-
-            # Death Cross: Sell signal
-            if (
-                self.sma_fast[-2] >= self.sma_slow[-2]
-                and self.sma_fast[-1] < self.sma_slow[-1]
-            ):
+            elif action == SELL:  # Death Cross
                 if self.position:
                     self.position.close()
@@ -4,6 +4,7 @@
 Provides DataValidator class for checking data freshness,
 validating database schema, and syncing data from MT5.
 """
+import sqlite3
 from datetime import datetime, timedelta
 
 import pandas as pd
@@ -28,6 +29,8 @@ class DataValidator:
         self.config = config
         self.mt5_conn = mt5_conn
         self.logger = LoggingFactory.get_logger(__name__)
+        # Warn only once when the deprecated backtest_market_data table is gone
+        self._backtest_table_missing_logged = False
         self.min_rows_per_symbol = config.get("data", {}).get(
             "min_rows_threshold", 5000
         )
@@ -198,50 +201,77 @@ class DataValidator:
             return False
 
     def sync_backtest_data(self, symbol):
-        """Sync market_data to backtest_market_data (no duplicates)"""
+        """Sync market_data to backtest_market_data (no duplicates)
+
+        Copies missing rows with a single INSERT ... SELECT so the
+        duplicate check runs inside SQLite instead of loading both tables
+        into pandas. Migration v1 merges backtest_market_data into
+        market_data and drops it, so the sync is skipped when the table
+        no longer exists rather than recreating it.
+        """
+        conn = self.db.conn
         try:
             tf_list = [
                 p["timeframe"] for p in self.config["pairs"] if p["symbol"] == symbol
             ]
+            if not tf_list:
+                return
+
+            table = conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type='table' AND name='backtest_market_data'"
+            ).fetchone()
+            if table is None:
+                if not self._backtest_table_missing_logged:
+                    self.logger.warning(
+                        "backtest_market_data table not found (merged into "
+                        "market_data by migration); skipping sync"
+                    )
+                    self._backtest_table_missing_logged = True
+                return
+
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(market_data)")]
+            insert_cols = ", ".join(columns)
+            select_cols = ", ".join(f"md.{col}" for col in columns)
+            query = f"""
+                INSERT INTO backtest_market_data ({insert_cols})
+                SELECT {select_cols} FROM market_data md
+                WHERE md.symbol = ? AND md.timeframe = ?
+                AND NOT EXISTS (
+                    SELECT 1 FROM backtest_market_data bmd
+                    WHERE bmd.symbol = md.symbol
+                    AND bmd.timeframe = md.timeframe
+                    AND bmd.time = md.time
+                )
+                ORDER BY md.time ASC
+            """
 
             for tf in tf_list:
                 tf_str = f"M{tf}" if tf < 60 else f"H{tf//60}"
 
-                # Read from market_data
-                query = "SELECT md.* FROM market_data md JOIN tradable_pairs tp ON md.symbol_id = tp.id WHERE tp.symbol = ? AND md.timeframe = ? ORDER BY md.time ASC"
-                data = pd.read_sql_query(query, self.db.conn, params=(symbol, tf_str))
-
-                if data.empty:
-                    self.logger.warning(
-                        "No data in market_data for %s (%s)", symbol, tf_str
-                    )
-                    continue
-
-                # Check for duplicates in backtest_market_data
-                try:
-                    existing = pd.read_sql_query(
-                        "SELECT bmd.time FROM backtest_market_data bmd JOIN tradable_pairs tp ON bmd.symbol_id = tp.id WHERE tp.symbol = ? AND bmd.timeframe = ?",
-                        self.db.conn,
-                        params=(symbol, tf_str),
-                    )
-                    if not existing.empty:
-                        data = data[~data["time"].isin(existing["time"])]
-                except (RuntimeError, ValueError, KeyError):
-                    pass
-
-                if not data.empty:
-                    data.to_sql(
-                        "backtest_market_data",
-                        self.db.conn,
-                        if_exists="append",
-                        index=False,
-                    )
-                    self.db.conn.commit()
+                cursor = conn.execute(query, (symbol, tf_str))
+                if cursor.rowcount > 0:
                     self.logger.info(
                         "Synced %d rows to backtest_market_data for %s (%s)",
-                        len(data),
+                        cursor.rowcount,
                         symbol,
                         tf_str,
                     )
-        except (RuntimeError, ValueError, KeyError) as e:
+                elif (
+                    conn.execute(
+                        "SELECT 1 FROM market_data "
+                        "WHERE symbol = ? AND timeframe = ? LIMIT 1",
+                        (symbol, tf_str),
+                    ).fetchone()
+                    is None
+                ):
+                    self.logger.warning(
+                        "No data in market_data for %s (%s)", symbol, tf_str
+                    )
+                else:
+                    self.logger.debug("No new rows to sync for %s (%s)", symbol, tf_str)
+            # One commit for all timeframes of the symbol
+            conn.commit()
+        except (sqlite3.Error, RuntimeError, ValueError, KeyError) as e:
+            conn.rollback()
             self.logger.error("Failed to sync backtest data for %s: %s", symbol, e)
@@ -401,10 +401,13 @@ class BackupManager:
         try:
             cutoff_time = time.time() - (max_age_days * 86400)
 
-            for backup_file in self.backup_dir.glob("*"):
-                if backup_file.stat().st_mtime < cutoff_time:
-                    backup_file.unlink()
-                    self._get_logger().info(f"Deleted old backup: {backup_file}")
+            # scandir lists the directory in one pass and its DirEntry objects
+            # cache stat results, unlike per-path Path.stat() calls
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        self._get_logger().info(f"Deleted old backup: {entry.path}")
 
         except Exception as e:
             self._get_logger().error(f"Error cleaning up backups: {e}")
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 import ta
 
@@ -289,6 +290,40 @@ class TrailingStopStrategy(BaseExitStrategy):
             confidence=1.0 if triggered else 0.5,
         )
 
+    def evaluate_series(
+        self, entry_price: float, prices: np.ndarray, position_side: str
+    ) -> np.ndarray:
+        """Evaluate the trailing stop over a whole price path at once.
+
+        Equivalent to calling evaluate() on every bar with highest_price set
+        to the running peak (trough for shorts) of the bars where trailing is
+        active, without the caller maintaining that running value. Per-position
+        tracking state is left untouched.
+
+        Args:
+            entry_price: Entry price
+            prices: Prices since entry, oldest first
+            position_side: 'long' or 'short'
+
+        Returns:
+            Boolean array, True on bars where the trailing stop is hit
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if entry_price <= 0:
+            pnl_pct = np.zeros_like(prices)
+        elif position_side.lower() == "long":
+            pnl_pct = (prices - entry_price) / entry_price * 100
+        else:
+            pnl_pct = (entry_price - prices) / entry_price * 100
+        active = pnl_pct >= self.activation_percent
+
+        if position_side.lower() == "long":
+            peaks = np.maximum.accumulate(np.where(active, prices, -np.inf))
+            return active & (prices <= peaks * (1 - self.trail_percent / 100))
+
+        troughs = np.minimum.accumulate(np.where(active, prices, np.inf))
+        return active & (prices >= troughs * (1 + self.trail_percent / 100))
+
     def reset_tracking(self, position_id: str = None):
         """Reset highest/lowest price tracking.
 
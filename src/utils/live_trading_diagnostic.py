@@ -95,10 +95,17 @@ class LiveTradingDiagnostic:
                 "trades",
             ]
 
+            # Resolve every table in one sqlite_master round trip
+            placeholders = ", ".join("?" for _ in tables_to_check)
+            query = (
+                "SELECT name FROM sqlite_master "
+                f"WHERE type='table' AND name IN ({placeholders})"
+            )
+            rows = self.db.execute_query(query, tuple(tables_to_check)).fetchall()
+            existing = {row[0] for row in rows}
+
             for table in tables_to_check:
-                query = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
-                result = self.db.execute_query(query, (table,)).fetchone()
-                if not result:
+                if table not in existing:
                     self.issues.append(f"Database table missing: {table}")
                 else:
                     self.info.append(f"[OK] Table exists: {table}")
@@ -28,6 +28,14 @@ from flask import request, abort, session
 import bleach
 from werkzeug.security import generate_password_hash, check_password_hash
 
+# Compiled once at import; prevent_sql_injection runs on every checked input
+_SQL_INJECTION_RE = re.compile(
+    r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER)\b)"
+    r"|(--|#|;)"  # SQL comments and statements
+    r"|('|\"|\*|=|\/)",  # Quote and operator escaping
+    re.IGNORECASE,
+)
+
 
 class InputValidator:
     """Validates and sanitizes user inputs"""
@@ -41,6 +49,7 @@ class InputValidator:
         "numeric": r"^-?\d+(\.\d+)?$",
         "integer": r"^-?\d+$",
     }
+    _COMPILED = {name: re.compile(pattern) for name, pattern in PATTERNS.items()}
 
     # Allowed HTML tags for rich text
     ALLOWED_TAGS = ["b", "i", "em", "strong", "a", "p", "br", "code", "pre"]
@@ -58,7 +67,7 @@ class InputValidator:
         """
         if not isinstance(email, str) or len(email) > 254:
             return False
-        return bool(re.match(InputValidator.PATTERNS["email"], email))
+        return bool(InputValidator._COMPILED["email"].match(email))
 
     @staticmethod
     def validate_username(username: str) -> bool:
@@ -72,7 +81,7 @@ class InputValidator:
         """
         if not isinstance(username, str):
             return False
-        return bool(re.match(InputValidator.PATTERNS["username"], username))
+        return bool(InputValidator._COMPILED["username"].match(username))
 
     @staticmethod
     def validate_symbol(symbol: str) -> bool:
@@ -86,7 +95,7 @@ class InputValidator:
         """
         if not isinstance(symbol, str):
             return False
-        return bool(re.match(InputValidator.PATTERNS["symbol"], symbol.upper()))
+        return bool(InputValidator._COMPILED["symbol"].match(symbol.upper()))
 
     @staticmethod
     def validate_numeric(
@@ -167,15 +176,8 @@ class InputValidator:
         Raises:
             ValueError: If potentially dangerous SQL patterns detected.
         """
-        dangerous_patterns = [
-            r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER)\b)",
-            r"(--|#|;)",  # SQL comments and statements
-            r"('|\"|\*|=|\/)",  # Quote and operator escaping
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, user_input, re.IGNORECASE):
-                raise ValueError(f"Potentially dangerous input detected: {user_input}")
+        if _SQL_INJECTION_RE.search(user_input):
+            raise ValueError(f"Potentially dangerous input detected: {user_input}")
 
         return user_input
 
@@ -1,13 +1,20 @@
 """Unit tests for backtest manager module."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 from src.backtesting.backtest_manager import BacktestManager
 
+TRADE_STATS = {
+    "total_trades": 2,
+    "winning_trades": 1,
+    "win_rate": 50.0,
+    "profit_factor": 2.0,
+}
+
 
 class TestBacktestManagerInitialization:
     """Test BacktestManager initialization."""
@@ -300,6 +307,717 @@ class TestTradeExecution:
         assert actual_price > expected_price
 
 
+class TestParameterGridExecution:
+    """Test parameter grid fan-out across worker processes."""
+
+    @pytest.fixture
+    def backtest_data(self):
+        """Create hourly OHLCV data in backtesting.py column format."""
+        rng = np.random.default_rng(7)
+        close = 1.2500 + np.cumsum(rng.normal(0, 0.001, 600))
+        return pd.DataFrame(
+            {
+                "Open": close,
+                "High": close + 0.0005,
+                "Low": close - 0.0005,
+                "Close": close,
+                "Volume": 1000.0,
+            },
+            index=pd.date_range("2024-01-01", periods=600, freq="h"),
+        )
+
+    def _run_grid(self, data, max_workers):
+        """Run a small RSI grid with the given worker count."""
+        from src.strategies.rsi_strategy import RSIStrategy
+
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.config = {"backtesting": {"max_workers": max_workers}}
+        param_dicts = [
+            {"period": period, "overbought": 70, "oversold": 30, "volume": 0.01}
+            for period in (7, 14)
+        ]
+        return manager._run_param_grid(
+            data, RSIStrategy.BacktestRSIStrategy, param_dicts
+        )
+
+    def test_parallel_grid_matches_serial(self, backtest_data):
+        """Test process-pool results equal serial results in grid order."""
+        serial = self._run_grid(backtest_data, max_workers=1)
+        parallel = self._run_grid(backtest_data, max_workers=2)
+
+        assert [p for p, _ in parallel] == [p for p, _ in serial]
+        for (_, expected), (_, actual) in zip(serial, parallel):
+            assert actual["# Trades"] == expected["# Trades"]
+            assert actual["Return [%]"] == expected["Return [%]"]
+
+    def test_results_drop_unused_bulky_fields(self, backtest_data):
+        """Test grid stats keep trades but not the equity curve or strategy."""
+        (_, stats), _ = self._run_grid(backtest_data, max_workers=1)
+
+        assert "_equity_curve" not in stats.index
+        assert "_strategy" not in stats.index
+        assert len(stats._trades) == stats["# Trades"]
+
+    def test_serial_grid_clears_indicator_memo(self, backtest_data):
+        """Test memoized indicator lines do not outlive a serial grid run."""
+        from src.strategies import signal_kernels
+
+        self._run_grid(backtest_data, max_workers=1)
+
+        assert not signal_kernels._indicator_cache
+
+    def test_shared_backtest_matches_fresh_instances(self, backtest_data):
+        """Test reusing one backtest across combinations gives identical stats."""
+        from src.backtesting.backtest_manager import (
+            _make_grid_backtest,
+            _run_param_combination,
+        )
+        from src.strategies.rsi_strategy import RSIStrategy
+
+        strategy_class = RSIStrategy.BacktestRSIStrategy
+        param_dicts = [
+            {"period": 7, "overbought": 70, "oversold": 30},
+            {"period": 14, "overbought": 65, "oversold": 35},
+        ]
+        shared = _make_grid_backtest(backtest_data, strategy_class)
+
+        for param_dict in param_dicts:
+            reused = _run_param_combination(param_dict, shared)
+            fresh = _run_param_combination(
+                param_dict, _make_grid_backtest(backtest_data, strategy_class)
+            )
+            assert reused["# Trades"] == fresh["# Trades"]
+            assert reused["Return [%]"] == fresh["Return [%]"]
+
+    def test_chunk_keeps_results_after_failure(self):
+        """Test a failing combination does not discard the rest of its slice."""
+        from src.backtesting.backtest_manager import _run_param_chunk
+
+        error = ValueError("bad params")
+        with patch(
+            "src.backtesting.backtest_manager._run_param_combination",
+            side_effect=["stats-a", error, "stats-c"],
+        ):
+            outcomes = _run_param_chunk([{"period": 7}, {"period": 0}, {"period": 21}])
+
+        assert outcomes == ["stats-a", error, "stats-c"]
+
+    def test_cached_results_skip_rerun(self, backtest_data, tmp_path):
+        """Test a repeated sweep is served from the disk cache."""
+        from src.strategies.rsi_strategy import RSIStrategy
+
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.config = {"backtesting": {"max_workers": 1}}
+        manager.logger = Mock()
+        manager._cache_dir = tmp_path
+        context = {
+            "symbol": "EURUSD",
+            "timeframe": "H1",
+            "strategy": "rsi",
+            "data_hash": BacktestManager._hash_data(backtest_data),
+        }
+        param_dicts = [{"period": 14, "overbought": 70, "oversold": 30}]
+
+        first = manager._run_param_grid(
+            backtest_data, RSIStrategy.BacktestRSIStrategy, param_dicts, context
+        )
+        with patch.object(
+            manager, "_execute_param_grid", return_value=[]
+        ) as mock_execute:
+            second = manager._run_param_grid(
+                backtest_data, RSIStrategy.BacktestRSIStrategy, param_dicts, context
+            )
+
+        mock_execute.assert_called_once_with(
+            backtest_data, RSIStrategy.BacktestRSIStrategy, []
+        )
+        assert second[0][1]["# Trades"] == first[0][1]["# Trades"]
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+
+class TestStatsCacheVersioning:
+    """Test the disk cache is opt-in and keyed on the code version."""
+
+    def test_cache_disabled_by_default(self):
+        """Test the stats cache is only used when configured."""
+        manager = BacktestManager({"database": {"path": ":memory:"}})
+        enabled = BacktestManager(
+            {"database": {"path": ":memory:"}, "backtesting": {"cache": True}}
+        )
+
+        assert manager.use_cache is False
+        assert enabled.use_cache is True
+
+    def test_code_version_tracks_backtesting_release(self, monkeypatch):
+        """Test a backtesting.py upgrade changes the cache key salt."""
+        from src.backtesting import backtest_manager
+        from src.strategies.rsi_strategy import RSIStrategy
+
+        strategy_class = RSIStrategy.BacktestRSIStrategy
+        backtest_manager._code_version.cache_clear()
+        before = backtest_manager._code_version(strategy_class)
+        monkeypatch.setattr(backtest_manager.backtesting, "__version__", "99.0")
+        backtest_manager._code_version.cache_clear()
+        after = backtest_manager._code_version(strategy_class)
+        backtest_manager._code_version.cache_clear()
+
+        assert before != after
+
+    def test_code_version_differs_per_strategy_module(self):
+        """Test strategies defined in different modules get different salts."""
+        from src.backtesting.backtest_manager import _code_version
+        from src.strategies.macd_strategy import MACDStrategy
+        from src.strategies.rsi_strategy import RSIStrategy
+
+        assert _code_version(RSIStrategy.BacktestRSIStrategy) != _code_version(
+            MACDStrategy.BacktestMACDStrategy
+        )
+
+
+class TestDataHashing:
+    """Test the content hash used for backtest cache keys."""
+
+    @pytest.fixture
+    def ohlcv(self):
+        """Create a small OHLCV frame."""
+        close = np.linspace(1.0, 1.1, 10)
+        return pd.DataFrame(
+            {"Open": close, "Close": close, "Volume": np.arange(10)},
+            index=pd.date_range("2024-01-01", periods=10, freq="h"),
+        )
+
+    def test_equal_frames_hash_equal(self, ohlcv):
+        """Test copies of a frame share a hash."""
+        assert BacktestManager._hash_data(ohlcv) == BacktestManager._hash_data(
+            ohlcv.copy()
+        )
+
+    def test_price_or_index_change_alters_hash(self, ohlcv):
+        """Test any value or timestamp change produces a new hash."""
+        changed_price = ohlcv.copy()
+        changed_price.iloc[3, 1] += 0.0001
+        shifted = ohlcv.copy()
+        shifted.index = shifted.index + pd.Timedelta(hours=1)
+
+        original = BacktestManager._hash_data(ohlcv)
+        assert BacktestManager._hash_data(changed_price) != original
+        assert BacktestManager._hash_data(shifted) != original
+
+
+class TestRankScores:
+    """Test the batched rank score computation."""
+
+    def test_matches_scalar_formula(self):
+        """Test each row scores as sharpe/10 + min(pf/5, 1) - |dd|*10, clamped."""
+        rows = [
+            {"sharpe_ratio": 2.0, "profit_factor": 1.5, "max_drawdown": -0.01},
+            {"sharpe_ratio": 8.0, "profit_factor": 9.0, "max_drawdown": 0},
+            {"sharpe_ratio": -1.0, "profit_factor": 0.5, "max_drawdown": -3.0},
+            {},
+        ]
+
+        scores = BacktestManager._rank_scores(rows)
+
+        expected = [
+            max(
+                0.0,
+                min(
+                    1.0,
+                    r.get("sharpe_ratio", 0) / 10.0
+                    + min(r.get("profit_factor", 0) / 5.0, 1.0)
+                    - abs(r.get("max_drawdown", 0)) * 10,
+                ),
+            )
+            for r in rows
+        ]
+        np.testing.assert_allclose(scores, expected)
+        assert scores.tolist()[1:] == [1.0, 0.0, 0.0]
+
+    def test_empty_batch(self):
+        """Test an empty batch yields an empty score array."""
+        assert BacktestManager._rank_scores([]).shape == (0,)
+
+
+class TestParameterGridBuilding:
+    """Test construction of optimization parameter grids."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a BacktestManager without touching the database."""
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.logger = Mock()
+        return manager
+
+    def test_rsi_grid_uses_optimization_candidates(self, manager):
+        """Test RSI combinations follow period/overbought/oversold order."""
+        grid = manager._build_param_grid(
+            "RSI",
+            {"volume": 0.05},
+            {"period": [7, 14], "overbought": [70], "oversold": [25, 30]},
+        )
+
+        assert len(grid) == 4
+        assert grid[0] == {
+            "period": 7,
+            "overbought": 70,
+            "oversold": 25,
+            "volume": 0.05,
+        }
+
+    def test_missing_candidates_fall_back_to_params(self, manager):
+        """Test parameters without candidates use the configured value."""
+        grid = manager._build_param_grid("ema", {"slow_period": 50}, {})
+
+        assert grid == [{"fast_period": 10, "slow_period": 50, "volume": 0.01}]
+
+    def test_degenerate_crossovers_are_skipped(self, manager):
+        """Test fast periods at or above the slow period are never run."""
+        grid = manager._build_param_grid(
+            "sma", {}, {"fast_period": [5, 15], "slow_period": [15, 20]}
+        )
+
+        pairs = [(p["fast_period"], p["slow_period"]) for p in grid]
+        assert pairs == [(5, 15), (5, 20), (15, 20)]
+
+    def test_max_combos_caps_grid(self, manager):
+        """Test oversized grids are truncated and a warning is logged."""
+        grid = manager._build_param_grid(
+            "macd",
+            {},
+            {"fast_period": [8, 12], "slow_period": [21, 26], "signal_period": [9]},
+            max_combos=3,
+        )
+
+        assert len(grid) == 3
+        manager.logger.warning.assert_called_once()
+
+
+class TestPreparedDataCache:
+    """Test reuse of prepared backtest data across runs."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a BacktestManager with a mocked data handler."""
+        from collections import OrderedDict
+
+        manager = BacktestManager.__new__(BacktestManager)
+        manager._data_handler = Mock()
+        manager._data_handler.prepare_backtest_data.side_effect = (
+            lambda *args: pd.DataFrame({"Close": [1.0]})
+        )
+        manager._data_cache = OrderedDict()
+        return manager
+
+    def test_same_window_loaded_once(self, manager):
+        """Test repeated requests for a window hit the database once."""
+        first = manager._get_prepared_data("EURUSD", "H1", "2024-01-01", "2024-06-30")
+        second = manager._get_prepared_data("EURUSD", "H1", "2024-01-01", "2024-06-30")
+
+        assert first is second
+        manager._data_handler.prepare_backtest_data.assert_called_once()
+
+    def test_cache_is_bounded(self, manager):
+        """Test the least recently used frame is evicted past the limit."""
+        from src.backtesting.backtest_manager import DATA_CACHE_SIZE
+
+        for i in range(DATA_CACHE_SIZE + 1):
+            manager._get_prepared_data(f"SYM{i}", "H1", None, None)
+
+        assert len(manager._data_cache) == DATA_CACHE_SIZE
+        assert ("SYM0", "H1", None, None) not in manager._data_cache
+
+
+class TestMultiBacktestTasks:
+    """Test dispatch of (symbol, timeframe) backtest tasks."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a BacktestManager on an in-memory database."""
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.config = {"backtesting": {}}
+        manager.db = Mock(db_path=":memory:")
+        manager.logger = Mock()
+        manager._run_single_backtest = Mock()
+        return manager
+
+    def test_in_memory_database_runs_serially(self, manager):
+        """Test tasks run in order on this manager when workers can't share the DB."""
+        tasks = [("EURUSD", "rsi", 15), ("EURUSD", "macd", 60), ("BTCUSD", "rsi", 60)]
+
+        completed = manager._execute_backtest_tasks(tasks, "2024-01-01", None)
+
+        assert completed == 3
+        assert [c.args for c in manager._run_single_backtest.call_args_list] == [
+            ("EURUSD", "rsi", "2024-01-01", None, 15),
+            ("EURUSD", "macd", "2024-01-01", None, 60),
+            ("BTCUSD", "rsi", "2024-01-01", None, 60),
+        ]
+
+    def test_pooled_results_stored_by_parent_in_one_batch(self, manager, monkeypatch):
+        """Test workers only compute and the parent stores their best runs."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.backtesting import backtest_manager
+
+        def fake_task(config, symbol, strategy_name, start, end, timeframe):
+            result = None if symbol == "BTCUSD" else (symbol, strategy_name, "M15")
+            return symbol, strategy_name, timeframe, result
+
+        monkeypatch.setattr(backtest_manager, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(backtest_manager, "_run_backtest_task", fake_task)
+        manager.db.db_path = "market_data.sqlite"
+        manager.use_cache = False
+        manager._store_backtest_results = Mock(return_value=1)
+        tasks = [("EURUSD", "rsi", 15), ("GBPUSD", "rsi", 15), ("BTCUSD", "rsi", 15)]
+
+        completed = manager._execute_backtest_tasks(tasks, None, None)
+
+        manager._run_single_backtest.assert_not_called()
+        (stored,) = manager._store_backtest_results.call_args.args
+        assert sorted(stored) == [("EURUSD", "rsi", "M15"), ("GBPUSD", "rsi", "M15")]
+        # One of the two results was not stored, so it is not reported
+        assert completed == 2
+
+    def test_failed_store_rolls_back_whole_batch(self):
+        """Test one failing result leaves none of the pooled results stored."""
+        from src.database.db_manager import DatabaseManager
+
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.db = DatabaseManager({"path": ":memory:"})
+        manager.db.connect()
+        manager.db.create_tables()
+        manager.db.execute_query(
+            "INSERT INTO tradable_pairs (symbol) VALUES (?)", ("EURUSD",)
+        )
+        manager.logger = Mock()
+        manager._symbol_ids = {}
+        manager._strategy_ids = {}
+        manager._extract_and_store_trades = Mock()
+        results = [
+            ("EURUSD", "rsi", "H1", {"sharpe_ratio": 1.0}, Mock(), {"period": 14}),
+            ("EURUSD", "macd", "H1", {"sharpe_ratio": 1.0}, Mock(), {"bad": object()}),
+        ]
+
+        with patch("src.backtesting.backtest_manager.ErrorHandler") as handler:
+            stored = manager._store_backtest_results(results)
+
+        handler.handle_error.assert_called_once()
+        assert stored == 0
+        count = manager.db.execute_query(
+            "SELECT COUNT(*) FROM backtest_backtests"
+        ).fetchone()[0]
+        assert count == 0
+        manager.db.close()
+
+    def test_partial_trade_batch_failure_leaves_no_trades(self):
+        """Test a trade batch failing midway in the pooled store leaves none of its rows."""
+        import sqlite3
+
+        from src.database.db_manager import DatabaseManager
+
+        trades = pd.DataFrame(
+            {
+                "entry_time": ["2024-01-01 00:00", "2024-01-02 00:00"],
+                "exit_time": ["2024-01-01 05:00", "2024-01-02 05:00"],
+                "entry_price": [1.10, 1.11],
+                "exit_price": [1.12, 1.10],
+                "size": [1000.0, 1000.0],
+                "pnl": [20.0, -10.0],
+                "pnl_pct": [1.8, -0.9],
+                "duration_hours": [5.0, 5.0],
+            }
+        )
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.db = DatabaseManager({"path": ":memory:"})
+        manager.db.connect()
+        manager.db.create_tables()
+        manager.db.execute_query(
+            "INSERT INTO tradable_pairs (symbol) VALUES (?)", ("EURUSD",)
+        )
+        manager.logger = Mock()
+        manager._symbol_ids = {}
+        manager._strategy_ids = {}
+        execute_many = manager.db.execute_many
+        calls = []
+
+        def fail_after_first_row(query, rows):
+            calls.append(rows)
+
+            def rows_then_error():
+                yield rows[0]
+                raise sqlite3.OperationalError("disk I/O error")
+
+            # Only the first backtest's batch fails, after inserting one row
+            return execute_many(query, rows_then_error() if len(calls) == 1 else rows)
+
+        manager.db.execute_many = fail_after_first_row
+        results = [
+            ("EURUSD", "rsi", "H1", {"sharpe_ratio": 1.0}, Mock(), {}),
+            ("EURUSD", "macd", "H1", {"sharpe_ratio": 1.0}, Mock(), {}),
+        ]
+
+        with patch(
+            "src.backtesting.backtest_manager.TradeExtractor"
+        ) as mock_extractor, patch("src.backtesting.backtest_manager.ErrorHandler"):
+            mock_extractor.extract_trades.return_value = trades
+            mock_extractor.calculate_trade_statistics.return_value = TRADE_STATS
+            stored = manager._store_backtest_results(results)
+
+        assert stored == 2
+        rows = manager.db.execute_query(
+            "SELECT s.name, COUNT(t.id) FROM backtest_backtests b "
+            "JOIN backtest_strategies s ON s.id = b.strategy_id "
+            "LEFT JOIN backtest_trades t ON t.backtest_backtest_id = b.id "
+            "GROUP BY s.name ORDER BY s.name"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [("macd", 2), ("rsi", 0)]
+        manager.db.close()
+
+    def test_run_backtest_expands_symbols_strategies_timeframes(self, manager):
+        """Test run_backtest dispatches every symbol/strategy/timeframe task."""
+        manager.config = {
+            "backtesting": {},
+            "strategies": [{"name": "rsi"}, {"name": "macd"}],
+            "timeframes": [15, 60],
+        }
+        manager.db.conn.cursor.return_value.fetchall.return_value = [(1, "EURUSD")]
+        manager._execute_backtest_tasks = Mock()
+
+        manager._run_backtest(None, None, None, None, None)
+
+        tasks = manager._execute_backtest_tasks.call_args.args[0]
+        assert tasks == [
+            ("EURUSD", "rsi", 15),
+            ("EURUSD", "rsi", 60),
+            ("EURUSD", "macd", 15),
+            ("EURUSD", "macd", 60),
+        ]
+
+    def test_config_lookups_keep_first_entry(self):
+        """Test pair timeframes keep config order and strategy names ignore case."""
+        config = {
+            "database": {"path": ":memory:"},
+            "pairs": [
+                {"symbol": "EURUSD", "timeframe": 60},
+                {"symbol": "BTCUSD", "timeframe": 15},
+                {"symbol": "EURUSD", "timeframe": 15},
+            ],
+            "strategies": [{"name": "RSI", "params": {}}, {"name": "rsi"}],
+        }
+        manager = BacktestManager(config)
+
+        assert manager._pair_timeframes == {"EURUSD": [60, 15], "BTCUSD": [15]}
+        assert manager._strategy_configs["rsi"] is config["strategies"][0]
+
+    def test_timeframe_label(self):
+        """Test minute timeframes map to M/H labels."""
+        assert BacktestManager._timeframe_label(15) == "M15"
+        assert BacktestManager._timeframe_label(240) == "H4"
+
+
+class TestStrategyIds:
+    """Test backtest_strategies id resolution."""
+
+    @pytest.mark.parametrize("has_returning", [True, False])
+    def test_ids_are_stable(self, has_returning, monkeypatch):
+        """Test a strategy keeps its id across lookups and fresh caches."""
+        monkeypatch.setattr(
+            "src.backtesting.backtest_manager.SQLITE_HAS_RETURNING", has_returning
+        )
+        manager = BacktestManager({"database": {"path": ":memory:"}})
+
+        rsi_id = manager._get_strategy_id("RSI")
+        macd_id = manager._get_strategy_id("macd")
+        manager._strategy_ids.clear()
+
+        assert manager._get_strategy_id("rsi") == rsi_id
+        assert macd_id != rsi_id
+        assert not manager.db.conn.in_transaction
+        count = manager.db.execute_query(
+            "SELECT COUNT(*) FROM backtest_strategies"
+        ).fetchone()
+        assert count[0] == 2
+
+    def test_run_backtest_preloads_strategy_ids(self):
+        """Test existing strategy ids are loaded without per-strategy upserts."""
+        manager = BacktestManager({"database": {"path": ":memory:"}})
+        manager.db.execute_query(
+            "INSERT INTO backtest_strategies (name) VALUES (?)", ("rsi",)
+        )
+        expected = manager.db.execute_query(
+            "SELECT id FROM backtest_strategies WHERE name = 'rsi'"
+        ).fetchone()[0]
+
+        manager._run_backtest(None, None, None, None, None)
+
+        assert manager._strategy_ids == {"rsi": expected}
+
+
+class TestTradeStorage:
+    """Test batched storage of extracted backtest trades."""
+
+    def test_trades_stored_in_one_batch(self):
+        """Test valid trades go through a single execute_many call."""
+        trades = pd.DataFrame(
+            {
+                "entry_time": ["2024-01-01 00:00", "2024-01-02 00:00", "bad"],
+                "exit_time": ["2024-01-01 05:00", "2024-01-02 05:00", "bad"],
+                "entry_price": [1.10, 1.11, "n/a"],
+                "exit_price": [1.12, 1.10, 1.0],
+                "size": [1000.0, 1000.0, 1.0],
+                "pnl": [20.0, -10.0, 0.0],
+                "pnl_pct": [1.8, -0.9, 0.0],
+                "duration_hours": [5.0, 5.0, 0.0],
+            }
+        )
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.db = MagicMock()
+        manager.logger = Mock()
+
+        with patch("src.backtesting.backtest_manager.TradeExtractor") as mock_extractor:
+            mock_extractor.extract_trades.return_value = trades
+            mock_extractor.calculate_trade_statistics.return_value = TRADE_STATS
+            manager._extract_and_store_trades(Mock(), 5, 3)
+
+        manager.db.execute_many.assert_called_once()
+        rows = manager.db.execute_many.call_args.args[1]
+        assert [(row[0], row[3]) for row in rows] == [(5, 3), (5, 3)]
+        assert rows[1][7] == -10.0
+        manager.logger.warning.assert_called_once()
+
+    def test_missing_columns_skip_storage(self):
+        """Test trades lacking a stored column warn once and write nothing."""
+        trades = pd.DataFrame(
+            {"entry_time": ["2024-01-01 00:00"], "exit_time": ["2024-01-01 05:00"]}
+        )
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.db = Mock()
+        manager.logger = Mock()
+
+        with patch("src.backtesting.backtest_manager.TradeExtractor") as mock_extractor:
+            mock_extractor.extract_trades.return_value = trades
+            manager._extract_and_store_trades(Mock(), 5, 3)
+
+        manager.db.execute_many.assert_not_called()
+        manager.logger.warning.assert_called_once()
+
+    def test_rerun_replaces_stored_trades(self):
+        """Test trades land in the real schema and a rerun replaces them."""
+        from src.database.db_manager import DatabaseManager
+
+        trades = pd.DataFrame(
+            {
+                "entry_time": ["2024-01-01 00:00", "2024-01-02 00:00"],
+                "exit_time": ["2024-01-01 05:00", "2024-01-02 05:00"],
+                "entry_price": [1.10, 1.11],
+                "exit_price": [1.12, 1.10],
+                "size": [1000.0, 1000.0],
+                "pnl": [20.0, -10.0],
+                "pnl_pct": [1.8, -0.9],
+                "duration_hours": [5.0, 5.0],
+            }
+        )
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.db = DatabaseManager({"path": ":memory:"})
+        manager.db.connect()
+        manager.db.create_tables()
+        manager.db.execute_query(
+            "INSERT INTO tradable_pairs (symbol) VALUES (?)", ("EURUSD",)
+        )
+        manager.logger = Mock()
+        manager._symbol_ids = {}
+        manager._strategy_ids = {}
+
+        with patch("src.backtesting.backtest_manager.TradeExtractor") as mock_extractor:
+            mock_extractor.extract_trades.return_value = trades
+            mock_extractor.calculate_trade_statistics.return_value = TRADE_STATS
+            for _ in range(2):
+                manager._save_backtest_results(
+                    "EURUSD", "rsi", "H1", {"sharpe_ratio": 1.0}, Mock(), {}
+                )
+
+        rows = manager.db.execute_query(
+            "SELECT t.backtest_backtest_id, t.symbol_id, t.profit FROM backtest_trades t "
+            "JOIN backtest_backtests b ON b.id = t.backtest_backtest_id "
+            "ORDER BY t.entry_time"
+        ).fetchall()
+        assert [row[2] for row in rows] == [20.0, -10.0]
+        assert {row[1] for row in rows} == {1}
+        manager.db.close()
+
+
+class TestHeatmap:
+    """Test the RSI optimization heatmap output."""
+
+    def test_heatmap_png_written(self, tmp_path, monkeypatch):
+        """Test the heatmap is saved as the PNG the dashboard serves."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "backtests" / "results").mkdir(parents=True)
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.logger = Mock()
+        results = [
+            ({"period": period, "oversold": oversold}, {"Sharpe Ratio": 0.5})
+            for period in (7, 14)
+            for oversold in (25, 30)
+        ]
+
+        manager.generate_heatmap(results, "EURUSD", "H1")
+
+        assert (
+            tmp_path
+            / "backtests"
+            / "results"
+            / "rsi_optimization_heatmap_EURUSD_H1.png"
+        ).exists()
+
+    def test_missing_cells_zero_and_nan_sharpe_blank(self, tmp_path, monkeypatch):
+        """Test only absent combinations are zero-filled in the plotted grid."""
+        from matplotlib.axes import Axes
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "backtests" / "results").mkdir(parents=True)
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.logger = Mock()
+        results = [
+            ({"period": 7, "oversold": 25}, {"Sharpe Ratio": 1.5}),
+            ({"period": 14, "oversold": 25}, {"Sharpe Ratio": float("nan")}),
+            ({"period": 7, "oversold": 30}, {"Sharpe Ratio": -0.5}),
+        ]
+        plotted = []
+        original_imshow = Axes.imshow
+
+        def capture(ax, data, *args, **kwargs):
+            plotted.append(data)
+            return original_imshow(ax, data, *args, **kwargs)
+
+        monkeypatch.setattr(Axes, "imshow", capture)
+
+        manager.generate_heatmap(results, "EURUSD", "H1")
+
+        np.testing.assert_array_equal(
+            plotted[0], np.array([[1.5, np.nan], [-0.5, 0.0]])
+        )
+
+
+class TestBacktestProfiling:
+    """Test the BACKTEST_PROFILE hook."""
+
+    def test_profile_dump_written_when_enabled(self, tmp_path, monkeypatch):
+        """Test run_backtest writes a cProfile dump when profiling is on."""
+        monkeypatch.setenv("BACKTEST_PROFILE", "1")
+        monkeypatch.setattr(
+            "src.backtesting.backtest_manager.PROFILE_DIR", tmp_path / "profiles"
+        )
+        manager = BacktestManager.__new__(BacktestManager)
+        manager.logger = Mock()
+        manager._run_backtest = Mock(__name__="_run_backtest", return_value=None)
+
+        manager.run_backtest("EURUSD", "rsi")
+
+        manager._run_backtest.assert_called_once_with("EURUSD", "rsi", None, None, None)
+        assert len(list((tmp_path / "profiles").glob("run_backtest_*.prof"))) == 1
+
+
 class TestBacktestResultsStorage:
     """Test backtest results storage."""
 
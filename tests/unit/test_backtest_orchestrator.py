@@ -338,6 +338,81 @@ class TestBacktestReporting:
         assert "1500" in output
 
 
+class TestMetricsCaching:
+    """Test calculate_metrics reuse across summary and results calls."""
+
+    @staticmethod
+    def _orchestrator():
+        orchestrator = BacktestOrchestrator("EURUSD", "RSI", "H1")
+        orchestrator.log_trade(
+            datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 12), 1.10, 1.11, 1.0, 10.0
+        )
+        orchestrator.set_returns(pd.Series([0.01, -0.005, 0.002, 0.004]))
+        return orchestrator
+
+    def test_summary_and_results_compute_once(self, monkeypatch):
+        """Test print_summary and get_results_dict share one calculation."""
+        orchestrator = self._orchestrator()
+        engine = orchestrator.metrics_engine
+        calls = []
+        original = engine.calculate_metrics_from_arrays
+
+        def counting(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(engine, "calculate_metrics_from_arrays", counting)
+
+        orchestrator.print_summary()
+        results = orchestrator.get_results_dict()
+
+        assert len(calls) == 1
+        assert results["metrics"] == orchestrator.calculate_metrics()
+
+    def test_new_trade_or_returns_recompute(self, monkeypatch):
+        """Test logging a trade or replacing returns invalidates the cache."""
+        orchestrator = self._orchestrator()
+        first = orchestrator.calculate_metrics()
+
+        orchestrator.log_trade(
+            datetime(2024, 1, 2, 10), datetime(2024, 1, 2, 12), 1.11, 1.10, 1.0, -5.0
+        )
+        second = orchestrator.calculate_metrics()
+        orchestrator.set_returns(pd.Series([0.02, 0.01, -0.01]))
+        third = orchestrator.calculate_metrics()
+
+        assert second["total_orders"] == first["total_orders"] + 1
+        assert third["sharpe_ratio"] != second["sharpe_ratio"]
+
+    def test_direct_trade_logger_and_returns_changes_recompute(self):
+        """Test trades logged on trade_logger or reassigned returns are seen."""
+        orchestrator = self._orchestrator()
+        first = orchestrator.calculate_metrics()
+
+        orchestrator.trade_logger.log_trade(
+            datetime(2024, 1, 2, 10),
+            datetime(2024, 1, 2, 12),
+            "EURUSD",
+            1.11,
+            1.10,
+            1.0,
+            -5.0,
+        )
+        second = orchestrator.calculate_metrics()
+        orchestrator.returns = pd.Series([0.02, 0.01, -0.01, 0.03])
+        third = orchestrator.calculate_metrics()
+
+        assert second["total_orders"] == first["total_orders"] + 1
+        assert third["sharpe_ratio"] != second["sharpe_ratio"]
+
+    def test_returned_metrics_are_copies(self):
+        """Test mutating a returned dict does not alter the cached metrics."""
+        orchestrator = self._orchestrator()
+        orchestrator.calculate_metrics()["total_orders"] = -1
+
+        assert orchestrator.calculate_metrics()["total_orders"] == 1
+
+
 class TestBacktestOrchestratorIntegration:
     """Integration tests for orchestrator."""
 
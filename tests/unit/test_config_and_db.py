@@ -89,3 +89,107 @@ class TestDatabaseManager:
             except Exception:
                 # Expected to raise error for invalid SQL
                 pass
+
+    def test_transaction_commits_once(self, db_manager):
+        """Test queries inside transaction() are committed together."""
+        with db_manager:
+            db_manager.execute_query("CREATE TABLE items (value INTEGER)")
+            with db_manager.transaction():
+                db_manager.execute_query("INSERT INTO items VALUES (1)")
+                db_manager.execute_query("INSERT INTO items VALUES (2)")
+                assert db_manager.conn.in_transaction
+
+            assert not db_manager.conn.in_transaction
+            count = db_manager.execute_query("SELECT COUNT(*) FROM items").fetchone()
+            assert count[0] == 2
+
+    def test_failed_nested_transaction_undoes_only_its_writes(self, db_manager):
+        """Test a handled failure in a nested block keeps the outer writes."""
+        with db_manager:
+            db_manager.execute_query("CREATE TABLE items (value INTEGER)")
+            with db_manager.transaction():
+                db_manager.execute_query("INSERT INTO items VALUES (1)")
+                with pytest.raises(RuntimeError):
+                    with db_manager.transaction():
+                        db_manager.execute_query("INSERT INTO items VALUES (2)")
+                        raise RuntimeError("boom")
+                db_manager.execute_query("INSERT INTO items VALUES (3)")
+
+            rows = db_manager.execute_query("SELECT value FROM items").fetchall()
+            assert [row[0] for row in rows] == [1, 3]
+
+    def test_execute_many_inserts_all_rows(self, db_manager):
+        """Test execute_many() stores every parameter row in one call."""
+        with db_manager:
+            db_manager.execute_query("CREATE TABLE items (value INTEGER)")
+            db_manager.execute_many(
+                "INSERT INTO items VALUES (?)", [(i,) for i in range(5)]
+            )
+
+            assert not db_manager.conn.in_transaction
+            count = db_manager.execute_query("SELECT COUNT(*) FROM items").fetchone()
+            assert count[0] == 5
+
+    def test_strategy_symbol_lookups_use_timestamp_index(self, db_manager):
+        """Test the (strategy, symbol, timestamp) index replaces the pair index."""
+        with db_manager:
+            db_manager.create_tables()
+            # Index left behind by databases created before the replacement
+            db_manager.execute_query(
+                "CREATE INDEX idx_backtest_backtests_strategy_symbol "
+                "ON backtest_backtests(strategy_id, symbol_id)"
+            )
+            db_manager.create_tables()
+            names = {
+                row[0]
+                for row in db_manager.execute_query(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                ).fetchall()
+            }
+            plan = db_manager.execute_query(
+                "EXPLAIN QUERY PLAN SELECT * FROM backtest_backtests "
+                "WHERE strategy_id = ? AND symbol_id = ?",
+                (1, 1),
+            ).fetchall()
+
+            assert "idx_backtest_backtests_strategy_symbol" not in names
+            assert "idx_backtest_backtests_strategy_symbol_ts" in " ".join(
+                row[-1] for row in plan
+            )
+
+    def test_market_data_pair_lookups_use_time_index(self, db_manager):
+        """Test the (symbol, timeframe, time) index replaces the pair index."""
+        with db_manager:
+            db_manager.create_tables()
+            # Index left behind by databases created before the replacement
+            db_manager.execute_query(
+                "CREATE INDEX idx_market_data_symbol_timeframe "
+                "ON market_data(symbol, timeframe)"
+            )
+            db_manager.create_tables()
+            names = {
+                row[0]
+                for row in db_manager.execute_query(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                ).fetchall()
+            }
+            plan = db_manager.execute_query(
+                "EXPLAIN QUERY PLAN SELECT * FROM market_data "
+                "WHERE symbol = ? AND timeframe = ?",
+                ("EURUSD", "H1"),
+            ).fetchall()
+
+            assert "idx_market_data_symbol_timeframe" not in names
+            assert "idx_market_data_symbol_tf_time" in " ".join(row[-1] for row in plan)
+
+    def test_transaction_rolls_back_on_error(self, db_manager):
+        """Test a failing transaction() block discards its writes."""
+        with db_manager:
+            db_manager.execute_query("CREATE TABLE items (value INTEGER)")
+            with pytest.raises(RuntimeError):
+                with db_manager.transaction():
+                    db_manager.execute_query("INSERT INTO items VALUES (1)")
+                    raise RuntimeError("boom")
+
+            count = db_manager.execute_query("SELECT COUNT(*) FROM items").fetchone()
+            assert count[0] == 0
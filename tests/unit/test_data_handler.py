@@ -1,5 +1,7 @@
 """Unit tests for data handler module."""
 
+import sqlite3
+
 import pytest
 from unittest.mock import Mock, patch
 import pandas as pd
@@ -217,6 +219,61 @@ class TestDataValidationInDataHandler:
         assert int(len(outliers)) > 0
 
 
+class TestPrepareBacktestData:
+    """Test loading backtest data from market_data."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a DataHandler backed by an in-memory market_data table."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE market_data (
+                time TEXT, symbol TEXT, timeframe TEXT, open REAL, high REAL,
+                low REAL, close REAL, tick_volume INTEGER)""")
+        times = pd.date_range("2026-01-01", periods=72, freq="h")
+        conn.executemany(
+            "INSERT INTO market_data VALUES (?,?,?,?,?,?,?,?)",
+            [
+                (
+                    t.strftime("%Y-%m-%d %H:%M:%S"),
+                    "EURUSD",
+                    "H1",
+                    1.1,
+                    1.2,
+                    1.0,
+                    1.15,
+                    5,
+                )
+                for t in times
+            ],
+        )
+        mock_db = Mock()
+        mock_db.conn = conn
+        return DataHandler(mock_db, {})
+
+    def test_loads_full_history_without_range(self, handler):
+        """Test all rows load with backtesting.py column names."""
+        data = handler.prepare_backtest_data("EURUSD", "H1")
+
+        assert len(data) == 72
+        assert list(data.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert isinstance(data.index, pd.DatetimeIndex)
+
+    def test_date_range_is_inclusive(self, handler):
+        """Test the SQL range keeps both boundary timestamps."""
+        data = handler.prepare_backtest_data("EURUSD", "H1", "2026-01-02", "2026-01-03")
+
+        assert data.index[0] == pd.Timestamp("2026-01-02 00:00:00")
+        assert data.index[-1] == pd.Timestamp("2026-01-03 00:00:00")
+        assert len(data) == 25
+
+    def test_empty_range_returns_none(self, handler):
+        """Test a window with no bars returns None."""
+        assert (
+            handler.prepare_backtest_data("EURUSD", "H1", "2025-01-01", "2025-01-31")
+            is None
+        )
+
+
 class TestDataCaching:
     """Test data caching functionality."""
 
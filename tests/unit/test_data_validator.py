@@ -1,10 +1,12 @@
 """Unit tests for data validator module."""
 
+import sqlite3
+
 import pytest
 import pandas as pd
 import numpy as np
 from datetime import timedelta
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.utils.data_validator import DataValidator
 
@@ -410,6 +412,84 @@ class TestDataConversionAndFormatting:
         assert df_sorted.index[0] < df_sorted.index[1] < df_sorted.index[2]
 
 
+class TestBacktestDataSync:
+    """Test copying market_data into backtest_market_data."""
+
+    @pytest.fixture
+    def validator(self):
+        """Create a validator backed by an in-memory market_data table."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE market_data (
+                time TEXT NOT NULL, symbol TEXT NOT NULL, timeframe TEXT NOT NULL,
+                open REAL, high REAL, low REAL, close REAL, tick_volume INTEGER,
+                PRIMARY KEY (time, symbol, timeframe))""")
+        rows = [
+            (f"2026-01-01 {hour:02d}:00:00", "EURUSD", "H1", 1.1, 1.2, 1.0, 1.1, 100)
+            for hour in range(5)
+        ]
+        rows.append(("2026-01-01 00:00:00", "GBPUSD", "H1", 1.3, 1.4, 1.2, 1.3, 50))
+        conn.executemany("INSERT INTO market_data VALUES (?,?,?,?,?,?,?,?)", rows)
+        conn.execute(
+            "CREATE TABLE backtest_market_data AS SELECT * FROM market_data WHERE 0"
+        )
+        mock_db = Mock()
+        mock_db.conn = conn
+        config = {"pairs": [{"symbol": "EURUSD", "timeframe": 60}]}
+        return DataValidator(mock_db, config)
+
+    def _synced_rows(self, validator):
+        """Return (time, symbol) rows in backtest_market_data."""
+        return validator.db.conn.execute(
+            "SELECT time, symbol FROM backtest_market_data ORDER BY time"
+        ).fetchall()
+
+    def test_sync_copies_only_requested_symbol(self, validator):
+        """Test sync copies every bar for the symbol and nothing else."""
+        validator.sync_backtest_data("EURUSD")
+
+        rows = self._synced_rows(validator)
+        assert len(rows) == 5
+        assert {symbol for _, symbol in rows} == {"EURUSD"}
+
+    def test_sync_skips_existing_rows(self, validator):
+        """Test repeated syncs only append new bars."""
+        validator.sync_backtest_data("EURUSD")
+        validator.db.conn.execute(
+            "INSERT INTO market_data VALUES (?,?,?,?,?,?,?,?)",
+            ("2026-01-01 05:00:00", "EURUSD", "H1", 1.1, 1.2, 1.0, 1.1, 100),
+        )
+        validator.sync_backtest_data("EURUSD")
+
+        assert len(self._synced_rows(validator)) == 6
+
+    def test_sync_skipped_when_table_dropped(self, validator):
+        """Test a dropped backtest_market_data table is not recreated."""
+        validator.db.conn.execute("DROP TABLE backtest_market_data")
+
+        with patch.object(validator.logger, "warning") as warning:
+            validator.sync_backtest_data("EURUSD")
+            validator.sync_backtest_data("EURUSD")
+
+        warning.assert_called_once()
+        assert (
+            validator.db.conn.execute(
+                "SELECT name FROM sqlite_master WHERE name='backtest_market_data'"
+            ).fetchone()
+            is None
+        )
+
+    def test_missing_market_data_warns(self, validator):
+        """Test a timeframe without market_data bars logs a warning."""
+        validator.config = {"pairs": [{"symbol": "EURUSD", "timeframe": 15}]}
+
+        with patch.object(validator.logger, "warning") as warning:
+            validator.sync_backtest_data("EURUSD")
+
+        warning.assert_called_once_with(
+            "No data in market_data for %s (%s)", "EURUSD", "M15"
+        )
+
+
 class TestDataValidationIntegration:
     """Integration tests for data validation."""
 
@@ -1,5 +1,6 @@
 """Unit tests for exit strategies module."""
 
+import numpy as np
 import pytest
 from datetime import datetime
 
@@ -522,6 +523,27 @@ class TestTrailingStopStrategy:
         # Verify no tracking data
         assert "pos1" not in strategy._highest_price
 
+    def test_evaluate_series_long(self):
+        """Test vectorized trailing stop over a long price path."""
+        strategy = TrailingStopStrategy(trail_percent=0.5, activation_percent=1.0)
+        prices = np.array([1.2550, 1.2650, 1.2750, 1.2720, 1.2680, 1.2700])
+
+        triggered = strategy.evaluate_series(1.2500, prices, "long")
+
+        # Peak 1.2750 -> stop 1.268625; only the 1.2680 bar breaches it
+        assert triggered.tolist() == [False, False, False, False, True, False]
+        assert strategy._highest_price == {}
+
+    def test_evaluate_series_short(self):
+        """Test vectorized trailing stop over a short price path."""
+        strategy = TrailingStopStrategy(trail_percent=0.5, activation_percent=0.0)
+        prices = np.array([1.2450, 1.2400, 1.2420, 1.2470])
+
+        triggered = strategy.evaluate_series(1.2500, prices, "short")
+
+        # Trough 1.2400 -> stop 1.2462; the 1.2470 bar breaches it
+        assert triggered.tolist() == [False, False, False, True]
+
 
 class TestEquityTargetExit:
     """Test EquityTargetExit strategy."""
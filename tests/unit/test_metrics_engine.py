@@ -663,3 +663,161 @@ class TestMetricsIntegration:
         avg_duration = sum(t["duration_minutes"] for t in trades) / len(trades)
         assert total_pnl == 250
         assert avg_duration == 70.0
+
+
+class TestTradeMetrics:
+    """Test trade statistics computed by calculate_all_metrics."""
+
+    def test_trade_metrics_from_profit_pct(self):
+        """Test win/loss statistics over mixed winning and losing trades."""
+        engine = MetricsEngine()
+        trades = [
+            {"profit": 0.02, "profit_pct": 2.0},
+            {"profit": -0.01, "profit_pct": -1.0},
+            {"profit": 0.04, "profit_pct": 4.0},
+            {"profit": -0.03, "profit_pct": -3.0},
+            {"profit_pct": 0.0},
+        ]
+
+        metrics = engine.calculate_all_metrics(trades, pd.Series(dtype=float))
+
+        assert metrics["total_orders"] == 5
+        assert metrics["total_profit_pct"] == pytest.approx(2.0)
+        assert metrics["profit_factor"] == pytest.approx(1.5)
+        assert metrics["win_rate_pct"] == pytest.approx(40.0)
+        assert metrics["winner_avg_pct"] == pytest.approx(3.0)
+        assert metrics["loser_avg_pct"] == pytest.approx(-2.0)
+        assert metrics["pl_ratio"] == pytest.approx(1.5)
+
+    def test_array_entry_point_matches_dicts(self):
+        """Test per-trade arrays give the same metrics as trade dicts."""
+        engine = MetricsEngine()
+        trades = [
+            {"profit": 0.02, "profit_pct": 2.0},
+            {"profit": -0.01, "profit_pct": -1.0},
+        ]
+        returns = pd.Series([0.01, -0.02, 0.015])
+
+        from_dicts = engine.calculate_all_metrics(trades, returns)
+        from_arrays = engine.calculate_metrics_from_arrays(
+            np.array([0.02, -0.01]), np.array([2.0, -1.0]), returns
+        )
+
+        assert from_arrays == from_dicts
+
+    def test_trade_metrics_without_trades(self):
+        """Test every trade statistic is zero for an empty trade list."""
+        engine = MetricsEngine()
+
+        metrics = engine.calculate_all_metrics([], pd.Series(dtype=float))
+
+        for key in ("total_profit_pct", "profit_factor", "win_rate_pct", "pl_ratio"):
+            assert metrics[key] == 0.0
+
+    def test_no_trades_still_computes_return_ratios(self):
+        """Test the no-trade path keeps return ratios, keys and key order."""
+        engine = MetricsEngine()
+        returns = pd.Series([0.01, -0.02, 0.005, 0.012])
+
+        empty = engine.calculate_all_metrics([], returns)
+        traded = engine.calculate_all_metrics(
+            [{"profit": 0.02, "profit_pct": 2.0}], returns
+        )
+
+        assert list(empty) == list(traded)
+        assert empty["total_orders"] == 0
+        assert isinstance(empty["total_orders"], int)
+        for key in (
+            "sharpe_ratio",
+            "annual_return_pct",
+            "max_drawdown_pct",
+            "sortino_ratio",
+            "calmar_ratio",
+        ):
+            assert empty[key] == traded[key]
+        assert empty["recovery_factor"] == 0.0
+
+
+class TestRollingMetrics:
+    """Test rolling return calculation."""
+
+    def test_rolling_return_over_window(self):
+        """Test each row is the cumulative-return change over the window."""
+        engine = MetricsEngine()
+        returns = pd.Series(
+            [0.01, 0.02, -0.01, 0.03],
+            index=pd.date_range("2024-01-01", periods=4, freq="D"),
+        )
+        cumulative = (1 + returns).cumprod() - 1
+
+        rolling = engine.calculate_rolling_metrics(returns, window_days=2)
+
+        assert list(rolling.index) == list(returns.index[2:])
+        assert rolling.index.name == "date"
+        np.testing.assert_allclose(
+            rolling["rolling_return_pct"].to_numpy(),
+            (cumulative.to_numpy()[2:] - cumulative.to_numpy()[:2]) * 100,
+        )
+
+    def test_short_series_returns_empty_frame(self):
+        """Test a series shorter than the window yields an empty frame."""
+        engine = MetricsEngine()
+
+        rolling = engine.calculate_rolling_metrics(pd.Series([0.01, 0.02]), 5)
+
+        assert rolling.empty
+
+
+class TestReturnMetrics:
+    """Test return-based ratios against the empyrical reference definitions."""
+
+    @pytest.fixture
+    def daily_returns(self):
+        """Create a year of synthetic daily returns with a missing day."""
+        rng = np.random.default_rng(3)
+        returns = pd.Series(
+            rng.normal(0.0005, 0.01, 252),
+            index=pd.date_range("2024-01-01", periods=252, freq="D"),
+        )
+        returns.iloc[10] = np.nan
+        return returns
+
+    def test_ratios_match_empyrical(self, daily_returns):
+        """Test each ratio equals the corresponding empyrical function."""
+        ep = pytest.importorskip("empyrical")
+        engine = MetricsEngine()
+
+        metrics = engine.calculate_all_metrics([], daily_returns)
+
+        assert metrics["sharpe_ratio"] == pytest.approx(
+            ep.sharpe_ratio(daily_returns, period="daily")
+        )
+        assert metrics["sortino_ratio"] == pytest.approx(
+            ep.sortino_ratio(daily_returns, period="daily")
+        )
+        assert metrics["annual_return_pct"] == pytest.approx(
+            ep.annual_return(daily_returns, period="daily") * 100
+        )
+        assert metrics["max_drawdown_pct"] == pytest.approx(
+            ep.max_drawdown(daily_returns) * 100
+        )
+        assert metrics["calmar_ratio"] == pytest.approx(
+            ep.calmar_ratio(daily_returns, period="daily")
+        )
+
+    def test_first_day_loss_is_a_drawdown(self):
+        """Test the starting value counts as the first peak."""
+        engine = MetricsEngine()
+
+        metrics = engine.calculate_all_metrics([], pd.Series([-0.1, 0.05]))
+
+        assert metrics["max_drawdown_pct"] == pytest.approx(-10.0)
+
+    def test_no_drawdown_has_no_calmar(self):
+        """Test Calmar is NaN when returns never fall."""
+        engine = MetricsEngine()
+
+        metrics = engine.calculate_all_metrics([], pd.Series([0.01, 0.02, 0.0]))
+
+        assert metrics["max_drawdown_pct"] == 0.0
+        assert np.isnan(metrics["calmar_ratio"])
@@ -0,0 +1,34 @@
+"""Unit tests for the compiled metrics kernels."""
+
+import numpy as np
+import pytest
+
+from src.backtesting.metrics_kernels import trade_pct_summary
+
+
+class TestTradePctSummary:
+    """Test suite for trade_pct_summary."""
+
+    def test_matches_masked_reductions(self):
+        """Test the fused pass equals separate NumPy mask reductions."""
+        rng = np.random.default_rng(7)
+        pcts = rng.normal(0, 2, 1000)
+        pcts[::50] = 0.0
+
+        count, wins, losses, gross_profit, gross_loss = trade_pct_summary(pcts)
+
+        assert count == 1000
+        assert wins == int((pcts > 0).sum())
+        assert losses == int((pcts < 0).sum())
+        assert gross_profit == pytest.approx(pcts[pcts > 0].sum())
+        assert gross_loss == pytest.approx(-pcts[pcts < 0].sum())
+
+    def test_nan_is_neither_win_nor_loss(self):
+        """Test NaN values only count towards the trade total."""
+        summary = trade_pct_summary(np.array([np.nan, 1.5, -0.5]))
+
+        assert summary == (3, 1, 1, 1.5, 0.5)
+
+    def test_empty_input(self):
+        """Test an empty array summarizes to zeros."""
+        assert trade_pct_summary(np.array([], dtype=np.float64)) == (0, 0, 0, 0.0, 0.0)
@@ -0,0 +1,159 @@
+"""Unit tests for the compiled strategy signal kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+
+from src.strategies import signal_kernels
+from src.strategies.signal_kernels import (
+    BUY,
+    HOLD,
+    SELL,
+    cached_macd_lines,
+    cached_rsi,
+    clear_indicator_cache,
+    ema_no_warmup,
+    cross_actions,
+    macd_lines,
+    rsi,
+    rsi_threshold_actions,
+)
+
+
+@pytest.fixture
+def close_prices():
+    """Create a synthetic random-walk close series."""
+    rng = np.random.default_rng(42)
+    return 1.10 + np.cumsum(rng.normal(0, 0.001, 500))
+
+
+class TestIndicatorKernels:
+    """Test suite verifying kernels reproduce the ta library exactly."""
+
+    @pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (8, 21, 5)])
+    def test_macd_lines_match_ta(self, close_prices, fast, slow, signal):
+        """Test MACD and signal lines are identical to ta.trend.MACD."""
+        expected = ta.trend.MACD(
+            pd.Series(close_prices),
+            window_fast=fast,
+            window_slow=slow,
+            window_sign=signal,
+        )
+
+        macd, sig = macd_lines(close_prices, fast, slow, signal)
+
+        np.testing.assert_array_equal(macd, expected.macd().to_numpy())
+        np.testing.assert_array_equal(sig, expected.macd_signal().to_numpy())
+
+    @pytest.mark.parametrize("period", [7, 14, 21])
+    def test_rsi_matches_ta(self, close_prices, period):
+        """Test RSI values are identical to ta.momentum.RSIIndicator."""
+        expected = ta.momentum.RSIIndicator(pd.Series(close_prices), window=period)
+
+        np.testing.assert_array_equal(
+            rsi(close_prices, period), expected.rsi().to_numpy()
+        )
+
+    @pytest.mark.parametrize("span", [5, 20])
+    def test_ema_no_warmup_matches_pandas(self, close_prices, span):
+        """Test seeded EMA is identical to Series.ewm(adjust=False)."""
+        expected = pd.Series(close_prices).ewm(span=span, adjust=False).mean()
+
+        np.testing.assert_array_equal(
+            ema_no_warmup(close_prices, span), expected.to_numpy()
+        )
+
+    def test_rsi_flat_prices(self):
+        """Test RSI saturates at 100 when there are no down moves."""
+        result = rsi(np.full(30, 1.25), 14)
+
+        assert np.isnan(result[:13]).all()
+        assert (result[13:] == 100.0).all()
+
+
+class TestIndicatorCache:
+    """Test suite for the memoized indicator helpers."""
+
+    def setup_method(self):
+        """Start every test with an empty cache."""
+        clear_indicator_cache()
+
+    def test_cached_macd_matches_uncached(self, close_prices):
+        """Test cached MACD lines equal a direct computation."""
+        macd, sig = cached_macd_lines(close_prices, 12, 26, 9)
+        expected_macd, expected_sig = macd_lines(close_prices, 12, 26, 9)
+
+        np.testing.assert_array_equal(macd, expected_macd)
+        np.testing.assert_array_equal(sig, expected_sig)
+
+    def test_repeated_calls_share_results(self, close_prices):
+        """Test identical inputs return the same read-only arrays."""
+        first = cached_rsi(close_prices, 14)
+        second = cached_rsi(close_prices.copy(), 14)
+
+        assert first is second
+        assert not first.flags.writeable
+        np.testing.assert_array_equal(first, rsi(close_prices, 14))
+
+    def test_different_prices_are_not_shared(self, close_prices):
+        """Test a changed price series produces a fresh result."""
+        first = cached_rsi(close_prices, 14)
+        second = cached_rsi(close_prices * 1.01, 14)
+
+        assert first is not second
+
+    def test_cache_keeps_no_copy_of_prices(self, close_prices):
+        """Test entries are keyed on a fixed-size digest, not the series."""
+        cached_rsi(close_prices, 14)
+
+        (key,) = signal_kernels._indicator_cache
+        assert key == ("rsi", (close_prices.shape[0], key[1][1]), 14)
+        assert len(key[1][1]) == 16
+
+    def test_cache_is_bounded(self, close_prices):
+        """Test the oldest entries are evicted beyond the size limit."""
+        for period in range(2, signal_kernels._CACHE_SIZE + 12):
+            cached_rsi(close_prices, period)
+
+        assert len(signal_kernels._indicator_cache) == signal_kernels._CACHE_SIZE
+
+
+class TestCrossActions:
+    """Test suite for cross_actions."""
+
+    def test_detects_bullish_and_bearish_crosses(self):
+        """Test crossover bars are flagged and other bars hold."""
+        macd = np.array([-1.0, 1.0, 2.0, -1.0, -2.0])
+        signal = np.zeros(5)
+
+        actions = cross_actions(macd, signal)
+
+        assert actions.tolist() == [HOLD, BUY, HOLD, SELL, HOLD]
+
+    def test_nan_warmup_holds(self):
+        """Test NaN warm-up values never produce an action."""
+        macd = np.array([np.nan, np.nan, 1.0, -1.0])
+        signal = np.array([np.nan, np.nan, 0.0, 0.0])
+
+        actions = cross_actions(macd, signal)
+
+        assert actions.tolist() == [HOLD, HOLD, HOLD, SELL]
+
+
+class TestRSIThresholdActions:
+    """Test suite for rsi_threshold_actions."""
+
+    def test_detects_threshold_crosses(self):
+        """Test oversold entry buys and overbought entry sells."""
+        rsi = np.array([50.0, 25.0, 20.0, 50.0, 75.0, 80.0])
+
+        actions = rsi_threshold_actions(rsi, 30.0, 70.0)
+
+        assert actions.tolist() == [HOLD, BUY, HOLD, HOLD, SELL, HOLD]
+
+    def test_empty_input(self):
+        """Test empty input returns an empty action array."""
+        actions = rsi_threshold_actions(np.array([], dtype=np.float64), 30.0, 70.0)
+
+        assert actions.shape == (0,)
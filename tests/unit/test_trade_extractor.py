@@ -338,6 +338,43 @@ class TestTradeExtractionIntegration:
         assert trade["pnl"] == 200
 
 
+class TestBacktestingTradesFrame:
+    """Test extraction from the _trades DataFrame of backtesting.py 0.6."""
+
+    def test_pnl_return_and_duration_columns_mapped(self):
+        """Test PnL, ReturnPct and Duration map to pnl, pnl_pct and hours."""
+        trades = pd.DataFrame(
+            {
+                "Size": [1000.0],
+                "EntryPrice": [1.10],
+                "ExitPrice": [1.12],
+                "PnL": [20.0],
+                "ReturnPct": [0.018],
+                "EntryTime": [pd.Timestamp("2024-01-01 00:00")],
+                "ExitTime": [pd.Timestamp("2024-01-01 05:00")],
+                "Duration": [pd.Timedelta(hours=5)],
+            }
+        )
+        stats = pd.Series({"_trades": trades})
+
+        result = TradeExtractor.extract_trades(stats)
+
+        row = result.iloc[0]
+        assert row["pnl"] == 20.0
+        assert row["pnl_pct"] == pytest.approx(1.8)
+        assert row["duration_hours"] == 5.0
+        assert list(result.columns) == [
+            "entry_time",
+            "exit_time",
+            "entry_price",
+            "exit_price",
+            "size",
+            "pnl",
+            "pnl_pct",
+            "duration_hours",
+        ]
+
+
 class TestTradeExtractorDataFrameHandling:
     """Test DataFrame handling and type safety in TradeExtractor."""
 
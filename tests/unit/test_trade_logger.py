@@ -3,6 +3,9 @@
 import pytest
 import tempfile
 import os
+from datetime import datetime, timedelta
+
+import numpy as np
 
 from src.backtesting.trade_logger import TradeLogger
 
@@ -372,3 +375,48 @@ class TestTradeLoggerIntegration:
         assert log["symbol"] == "EURUSD"
         assert log["strategy"] == "RSI"
         assert log["pnl"] == 200
+
+
+class TestColumnarStorage:
+    """Test TradeLogger's column-wise trade storage."""
+
+    @pytest.fixture
+    def trade_logger(self):
+        """Create a logger holding one winning and one losing trade."""
+        trade_logger = TradeLogger()
+        start = datetime(2024, 1, 1, 9, 0)
+        trade_logger.log_trade(
+            start, start + timedelta(hours=2), "EURUSD", 1.10, 1.12, 1.0, 20.0
+        )
+        trade_logger.log_trade(
+            start, start + timedelta(hours=4), "GBPUSD", 1.25, 1.20, 1.0, -50.0
+        )
+        return trade_logger
+
+    def test_trades_rebuilt_as_dicts(self, trade_logger):
+        """Test get_trades returns one complete dict per logged trade."""
+        trades = trade_logger.get_trades()
+
+        assert [t["symbol"] for t in trades] == ["EURUSD", "GBPUSD"]
+        assert trades[1]["profit"] == -50.0
+        assert trades[0]["duration_hours"] == 2.0
+        assert trade_logger.get_trades_df().shape == (2, 9)
+
+    def test_get_column_returns_array(self, trade_logger):
+        """Test a numeric field comes back as an aligned float64 array."""
+        profits = trade_logger.get_column("profit")
+
+        assert profits.dtype == np.float64
+        np.testing.assert_array_equal(profits, [20.0, -50.0])
+
+    def test_summary_and_clear(self, trade_logger):
+        """Test the summary reads the columns and clear empties them."""
+        summary = trade_logger.get_summary()
+
+        assert summary["total_trades"] == 2
+        assert summary["win_rate"] == 50.0
+        assert summary["total_profit"] == -30.0
+
+        trade_logger.clear()
+        assert trade_logger.get_trade_count() == 0
+        assert trade_logger.get_trades_df().empty